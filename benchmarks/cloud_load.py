@@ -0,0 +1,146 @@
+"""Stress polling, action tracking and reauth against the mock cloud.
+
+Run from the repository root with the requirements installed:
+
+    python3 -m benchmarks.cloud_load [--vehicles 300] [--rounds 5] [--actions-per-round 10]
+        [--latency-ms 400 --latency-sigma 0.5] [--error-rate 0.01] [--session-ttl 30]
+
+Starts the mock cloud in process, logs one shared account in with a refresh
+token and polls every vehicle concurrently through the real coordinator refresh
+each round. Some vehicles lock each round and are followed by the action
+tracker. Prints one JSON document with poll latencies, errors by type and the
+request counts the cloud saw.
+"""
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from statistics import quantiles
+from tempfile import TemporaryDirectory
+from time import monotonic, perf_counter
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ha_kia_hyundai.account import KiaAccount
+from custom_components.ha_kia_hyundai.const import CONF_RATE_LIMIT_BURST, CONF_RATE_LIMIT_PER_MINUTE
+from custom_components.ha_kia_hyundai.vehicle_coordinator import VehicleCoordinator
+
+from .common import emit
+from .harness import async_create_hass, create_coordinator
+from .mock_cloud import MockKiaCloud, async_start, cloud_from_arguments, fault_arguments, point_at
+
+
+def latency_summary(durations: list[float]) -> dict:
+    if len(durations) < 2:
+        return {"count": len(durations)}
+    percentiles = quantiles(durations, n=100)
+    return {
+        "count": len(durations),
+        "p50_ms": percentiles[49] * 1_000,
+        "p95_ms": percentiles[94] * 1_000,
+        "p99_ms": percentiles[98] * 1_000,
+        "max_ms": max(durations) * 1_000,
+    }
+
+
+async def async_poll_round(coordinators: list[VehicleCoordinator], durations: list[float], errors: Counter) -> None:
+    async def poll(coordinator: VehicleCoordinator) -> None:
+        start = perf_counter()
+        try:
+            await coordinator.update_method()
+        except Exception as err:
+            errors[type(err).__name__] += 1
+        else:
+            durations.append(perf_counter() - start)
+
+    await asyncio.gather(*(poll(coordinator) for coordinator in coordinators))
+
+
+async def async_start_actions(coordinators: list[VehicleCoordinator], count: int, errors: Counter) -> int:
+    started = 0
+    for coordinator in random.sample(coordinators, min(count, len(coordinators))):
+        try:
+            await coordinator.command_queue.async_run("lock")
+        except Exception as err:
+            errors[type(err).__name__] += 1
+            continue
+        started += 1
+    return started
+
+
+async def async_run(hass: HomeAssistant, cloud: MockKiaCloud, api_url: str, args: argparse.Namespace) -> dict:
+    account = KiaAccount(
+        hass,
+        username="mock@example.com",
+        password="mock",
+        device_id=None,
+        refresh_token=cloud.issue_refresh_token(),
+    )
+    point_at(account.api_connection, api_url)
+    account.set_rate_limits("cloud_load", {
+        CONF_RATE_LIMIT_BURST: args.rate_limit_burst,
+        CONF_RATE_LIMIT_PER_MINUTE: args.rate_limit_per_minute,
+    })
+    coordinators = [
+        create_coordinator(
+            hass,
+            vehicle["vehicleIdentifier"],
+            vehicle_name=vehicle["nickName"],
+            vehicle_model=vehicle["modelName"],
+            api_connection=account.vehicle(vehicle["vehicleIdentifier"]),
+        )
+        for vehicle in await account.async_get_vehicles()
+    ]
+    durations: list[float] = []
+    errors: Counter = Counter()
+    actions = 0
+    for _ in range(args.rounds):
+        await async_poll_round(coordinators, durations, errors)
+        actions += await async_start_actions(coordinators, args.actions_per_round, errors)
+    deadline = monotonic() + args.settle_seconds
+    while monotonic() < deadline and any(coordinator.action_tracker.tracking for coordinator in coordinators):
+        await asyncio.sleep(1)
+    return {
+        "vehicles": len(coordinators),
+        "rounds": args.rounds,
+        "polls": latency_summary(durations),
+        "errors": dict(errors),
+        "actions_started": actions,
+        "actions_still_tracked": sum(coordinator.action_tracker.tracking for coordinator in coordinators),
+        "cloud": cloud.stats.as_dict(),
+    }
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    cloud = cloud_from_arguments(args)
+    runner, api_url = await async_start(cloud)
+    try:
+        with TemporaryDirectory() as config_dir:
+            hass = await async_create_hass(config_dir)
+            try:
+                results = await async_run(hass, cloud, api_url, args)
+            finally:
+                await hass.async_stop(force=True)
+    finally:
+        await runner.cleanup()
+    return {"benchmark": "cloud_load", "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    fault_arguments(parser)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--actions-per-round", type=int, default=10)
+    parser.add_argument("--settle-seconds", type=float, default=60)
+    # high defaults measure the cloud, lower them to see the account limiter at work
+    parser.add_argument("--rate-limit-burst", type=int, default=1000)
+    parser.add_argument("--rate-limit-per-minute", type=int, default=60000)
+    parser.set_defaults(vehicles=300)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    emit(asyncio.run(async_main(args)))
+
+
+if __name__ == "__main__":
+    main()
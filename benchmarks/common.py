@@ -0,0 +1,46 @@
+"""Payload loading, timing and output helpers shared by the benchmarks."""
+
+import json
+import sys
+import timeit
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+PAYLOADS = Path(__file__).parent / "payloads"
+PAYLOAD_NAMES = ("ev", "phev", "ice")
+VEHICLE_COUNTS = (1, 10, 100)
+REPEAT = 5
+
+
+def load_payload(name: str) -> dict:
+    with open(PAYLOADS / f"{name}.json") as payload_file:
+        return json.load(payload_file)
+
+
+def best_of(func: Callable[[], Any], number: int) -> float:
+    """Return the seconds per call of the fastest of the repeats."""
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+
+
+async def async_best_of(func: Callable[[], Awaitable[Any]], number: int) -> float:
+    """Return the seconds per awaited call of the fastest of the repeats."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = perf_counter()
+        for _ in range(number):
+            await func()
+        best = min(best, perf_counter() - start)
+    return best / number
+
+
+def emit(document: dict, output: str | None = None) -> None:
+    """Write the results as json to the output file or stdout."""
+    if output is None:
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    with open(output, "w") as output_file:
+        json.dump(document, output_file, indent=2)
+        output_file.write("\n")
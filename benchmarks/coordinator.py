@@ -0,0 +1,93 @@
+"""Time the coordinator refresh closure and every VehicleCoordinator property.
+
+Run from the repository root with the requirements installed:
+
+    python3 -m benchmarks.coordinator [--payload ev] [--vehicles 1 10 100] [--number 20]
+
+The refresh is timed for all vehicles in turn, the api answers instantly so
+only the integration's own work per poll is measured.
+"""
+
+import argparse
+import asyncio
+from tempfile import TemporaryDirectory
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ha_kia_hyundai.vehicle_coordinator import VehicleCoordinator
+from custom_components.ha_kia_hyundai.vehicle_snapshot import FIELD_NAMES
+
+from .common import VEHICLE_COUNTS, async_best_of, best_of, emit, load_payload
+from .harness import async_create_hass, create_vehicles
+
+PROPERTY_NAMES = ("id", "last_action_name", *FIELD_NAMES)
+PROPERTY_READS = 10_000
+
+
+async def async_time_refresh(coordinators: list[VehicleCoordinator], number: int) -> dict:
+    async def refresh_all() -> None:
+        for coordinator in coordinators:
+            await coordinator.update_method()
+
+    seconds = await async_best_of(refresh_all, number)
+    return {
+        "ms_per_poll": seconds * 1_000,
+        "us_per_vehicle": seconds / len(coordinators) * 1_000_000,
+    }
+
+
+def time_properties(coordinators: list[VehicleCoordinator]) -> dict:
+    coordinator = coordinators[0]
+    per_property = {
+        name: best_of(lambda name=name: getattr(coordinator, name), PROPERTY_READS) * 1_000_000_000
+        for name in PROPERTY_NAMES
+    }
+
+    def read_all() -> None:
+        for vehicle in coordinators:
+            for name in PROPERTY_NAMES:
+                getattr(vehicle, name)
+
+    seconds = best_of(read_all, max(1, PROPERTY_READS // (len(coordinators) * len(PROPERTY_NAMES))))
+    return {
+        "ns_per_read": per_property,
+        "us_all_properties": seconds * 1_000_000,
+    }
+
+
+async def async_run(hass: HomeAssistant, payload: str, vehicle_counts: tuple[int, ...], number: int) -> dict:
+    data = load_payload(payload)
+    refresh = {}
+    properties = {}
+    for count in vehicle_counts:
+        coordinators = create_vehicles(hass, payload, data, count)
+        refresh[count] = await async_time_refresh(coordinators, number)
+        properties[count] = time_properties(coordinators)
+    return {"refresh": refresh, "properties": properties}
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    with TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        try:
+            results = await async_run(hass, args.payload, tuple(args.vehicles), args.number)
+        finally:
+            await hass.async_stop(force=True)
+    return {
+        "benchmark": "coordinator",
+        "payload": args.payload,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", default="ev")
+    parser.add_argument("--vehicles", type=int, nargs="+", default=list(VEHICLE_COUNTS))
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    emit(asyncio.run(async_main(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Time the full state write of every entity of a platform.
+
+Run from the repository root with the requirements installed:
+
+    python3 -m benchmarks.entities [--payload ev] [--vehicles 1 10 100] [--number 20]
+
+Each write builds the state and attributes and hands them to the state
+machine, values do not change between writes like in a steady poll.
+"""
+
+import argparse
+import asyncio
+from tempfile import TemporaryDirectory
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from .common import VEHICLE_COUNTS, best_of, emit, load_payload
+from .harness import async_create_entities, async_create_hass, create_vehicles
+
+STATE_WRITE_PLATFORMS = (Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SELECT, Platform.NUMBER)
+
+
+def time_state_writes(entities: list[Entity], number: int) -> dict:
+    if not entities:
+        return {"entities": 0}
+
+    def write_all() -> None:
+        for entity in entities:
+            entity.async_write_ha_state()
+
+    seconds = best_of(write_all, number)
+    return {
+        "entities": len(entities),
+        "ms_per_write_all": seconds * 1_000,
+        "us_per_entity": seconds / len(entities) * 1_000_000,
+    }
+
+
+async def async_run(hass: HomeAssistant, payload: str, vehicle_counts: tuple[int, ...], number: int) -> dict:
+    data = load_payload(payload)
+    results = {}
+    for platform in STATE_WRITE_PLATFORMS:
+        results[platform] = {}
+        for count in vehicle_counts:
+            entities = []
+            for coordinator in create_vehicles(hass, payload, data, count):
+                entities.extend(await async_create_entities(hass, coordinator, platform))
+            results[platform][count] = time_state_writes(entities, number)
+    return results
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    with TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        try:
+            results = await async_run(hass, args.payload, tuple(args.vehicles), args.number)
+        finally:
+            await hass.async_stop(force=True)
+    return {
+        "benchmark": "entities",
+        "payload": args.payload,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", default="ev")
+    parser.add_argument("--vehicles", type=int, nargs="+", default=list(VEHICLE_COUNTS))
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    emit(asyncio.run(async_main(args)))
+
+
+if __name__ == "__main__":
+    main()
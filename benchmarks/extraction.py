@@ -0,0 +1,66 @@
+"""Compare compiled snapshot extraction with per access safely_get_json_value.
+
+Run from the repository root with the requirements installed:
+
+    python3 -m benchmarks.extraction [--payload ev] [--reads 3] [--number 2000]
+
+Prints one JSON document with the mean cost per simulated poll, where a poll
+reads every field `--reads` times (available, native_value, icon, ...).
+"""
+
+import argparse
+
+from custom_components.ha_kia_hyundai.util import safely_get_json_value
+from custom_components.ha_kia_hyundai.vehicle_snapshot import FIELDS, build_snapshot
+
+from .common import best_of, emit, load_payload
+
+
+def legacy_poll(data: dict, reads: int) -> None:
+    for _ in range(reads):
+        for field in FIELDS:
+            value = None
+            for path in field.paths:
+                try:
+                    value = safely_get_json_value(data, path, field.cast)
+                except (TypeError, ValueError):
+                    value = None
+                if value:
+                    break
+
+
+def compiled_poll(data: dict, reads: int) -> None:
+    snapshot = build_snapshot(data)
+    for _ in range(reads):
+        for field in FIELDS:
+            getattr(snapshot, field.name)
+
+
+def run(payload: str, reads: int, number: int) -> dict:
+    data = load_payload(payload)
+    results = {}
+    for name, poll in (("safely_get_json_value", legacy_poll), ("compiled_snapshot", compiled_poll)):
+        results[name] = {"us_per_poll": best_of(lambda: poll(data, reads), number) * 1_000_000}
+    results["speedup"] = (
+        results["safely_get_json_value"]["us_per_poll"] / results["compiled_snapshot"]["us_per_poll"]
+    )
+    return {
+        "benchmark": "extraction",
+        "payload": payload,
+        "fields": len(FIELDS),
+        "reads_per_field": reads,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", default="ev")
+    parser.add_argument("--reads", type=int, default=3)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+    emit(run(args.payload, args.reads, args.number))
+
+
+if __name__ == "__main__":
+    main()
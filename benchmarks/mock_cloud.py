@@ -0,0 +1,462 @@
+"""Local stand in for the Kia US owners api with latency and fault injection.
+
+Run from the repository root with the requirements installed:
+
+    python3 -m benchmarks.mock_cloud [--vehicles 300] [--latency-ms 400 --latency-sigma 0.5]
+        [--error-rate 0.01 --burst-length 5] [--stuck-rate 0.05] [--session-ttl 600]
+
+Serves the endpoints UsKia calls under http://HOST:PORT/apigw/v1/, replaying the
+recorded payloads for every simulated vehicle. Commands change the replayed
+status once their action finishes, so polling and action tracking see the same
+transitions as with a real car. A refresh token printed on start logs in without
+an OTP, expired or unknown tokens fall back to the OTP flow with --otp-code.
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import random
+import secrets
+import sys
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from time import monotonic
+from typing import Any
+
+from aiohttp import web
+
+from .common import PAYLOAD_NAMES, load_payload
+
+API_PATH = "/apigw/v1/"
+STATUS = ("lastVehicleInfo", "vehicleStatusRpt", "vehicleStatus")
+# error codes UsKia treats as an invalid session
+SESSION_EXPIRED = 1003
+
+
+@dataclass
+class FaultConfig:
+    """How the mock cloud misbehaves."""
+
+    # lognormal around the median, a sigma of 0 gives a fixed latency
+    latency_ms: float = 0
+    latency_sigma: float = 0
+    # chance a request starts a burst of http errors
+    error_rate: float = 0
+    burst_length: int = 1
+    error_statuses: tuple[int, ...] = (429, 503)
+    retry_after: int = 30
+    # seconds until an action reports finished, stuck actions never do
+    action_seconds: float = 5
+    stuck_rate: float = 0
+    session_ttl: float = 3600
+    # None keeps refresh tokens valid forever
+    refresh_token_ttl: float | None = None
+    otp_code: str = "123456"
+
+
+@dataclass
+class MockVehicle:
+    vehicle_id: str
+    vehicle_key: str
+    nickname: str
+    model: str
+    payload: dict[str, Any]
+
+    @property
+    def status(self) -> dict[str, Any]:
+        return self.payload[STATUS[0]][STATUS[1]][STATUS[2]]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "vehicleIdentifier": self.vehicle_id,
+            "vehicleKey": self.vehicle_key,
+            "nickName": self.nickname,
+            "modelName": self.model,
+        }
+
+
+@dataclass
+class MockAction:
+    vehicle: MockVehicle
+    apply: Callable[[MockVehicle], None]
+    # None for a stuck action
+    finishes_at: float | None
+    applied: bool = False
+
+    def finished(self, now: float) -> bool:
+        return self.finishes_at is not None and now >= self.finishes_at
+
+
+@dataclass
+class MockStats:
+    requests: Counter = field(default_factory=Counter)
+    http_errors: Counter = field(default_factory=Counter)
+    expired_sessions: int = 0
+    logins: int = 0
+    otp_logins: int = 0
+    actions: int = 0
+    stuck_actions: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "http_errors": {str(status): count for status, count in self.http_errors.items()},
+            "expired_sessions": self.expired_sessions,
+            "logins": self.logins,
+            "otp_logins": self.otp_logins,
+            "actions": self.actions,
+            "stuck_actions": self.stuck_actions,
+        }
+
+
+def build_vehicles(count: int, payload_names: tuple[str, ...] = PAYLOAD_NAMES) -> list[MockVehicle]:
+    """Return count vehicles cycling through the recorded payloads."""
+    recorded = {name: load_payload(name) for name in payload_names}
+    vehicles = []
+    for index in range(count):
+        name = payload_names[index % len(payload_names)]
+        payload = copy.deepcopy(recorded[name])
+        vehicle_key = f"mock-key-{index}"
+        payload["vinKey"] = vehicle_key
+        vehicles.append(MockVehicle(
+            vehicle_id=f"mock-{index}",
+            vehicle_key=vehicle_key,
+            nickname=f"Mock {name.upper()} {index}",
+            model=name.upper(),
+            payload=payload,
+        ))
+    return vehicles
+
+
+def _kia_time() -> dict[str, Any]:
+    return {"utc": datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S"), "offset": 0}
+
+
+def _synced(vehicle: MockVehicle) -> None:
+    status = vehicle.status
+    status["syncDate"] = _kia_time()
+    if "evStatus" in status:
+        status["evStatus"]["syncDate"] = _kia_time()
+
+
+def _door_lock(locked: bool) -> Callable[[MockVehicle], None]:
+    def apply(vehicle: MockVehicle) -> None:
+        vehicle.status["doorLock"] = locked
+        _synced(vehicle)
+    return apply
+
+
+def _climate(on: bool, body: dict[str, Any]) -> Callable[[MockVehicle], None]:
+    remote_climate = body.get("remoteClimate", {})
+
+    def apply(vehicle: MockVehicle) -> None:
+        climate = vehicle.status["climate"]
+        climate["airCtrl"] = on and remote_climate.get("airCtrl", True)
+        climate["defrost"] = on and remote_climate.get("defrost", False)
+        if on and "airTemp" in remote_climate:
+            climate["airTemp"]["value"] = remote_climate["airTemp"]["value"]
+        vehicle.status["engine"] = on
+        _synced(vehicle)
+    return apply
+
+
+def _charging(on: bool) -> Callable[[MockVehicle], None]:
+    def apply(vehicle: MockVehicle) -> None:
+        ev_status = vehicle.status.get("evStatus")
+        if ev_status is not None:
+            ev_status["batteryCharge"] = on and ev_status.get("batteryPlugin", 0) != 0
+        _synced(vehicle)
+    return apply
+
+
+def _charge_limits(body: dict[str, Any]) -> Callable[[MockVehicle], None]:
+    levels = {item["plugType"]: item["targetSOClevel"] for item in body.get("targetSOClist", [])}
+
+    def apply(vehicle: MockVehicle) -> None:
+        ev_status = vehicle.status.get("evStatus")
+        if ev_status is not None:
+            for target in ev_status.get("targetSOC", []):
+                target["targetSOClevel"] = levels.get(target["plugType"], target["targetSOClevel"])
+        _synced(vehicle)
+    return apply
+
+
+class MockKiaCloud:
+    """The owners api as an aiohttp application."""
+
+    def __init__(self, vehicles: list[MockVehicle], faults: FaultConfig, seed: int | None = None) -> None:
+        self.vehicles: dict[str, MockVehicle] = {vehicle.vehicle_key: vehicle for vehicle in vehicles}
+        self.faults: FaultConfig = faults
+        self.stats: MockStats = MockStats()
+        self._random = random.Random(seed)
+        self._sessions: dict[str, float] = {}
+        self._refresh_tokens: dict[str, float | None] = {}
+        self._otp_keys: dict[str, str] = {}
+        self._actions: dict[str, MockAction] = {}
+        # actions not yet applied, per vehicle key
+        self._pending: dict[str, list[MockAction]] = {}
+        self._burst_left: int = 0
+        self._burst_status: int = 0
+
+    def issue_refresh_token(self) -> str:
+        token = secrets.token_urlsafe(32)
+        ttl = self.faults.refresh_token_ttl
+        self._refresh_tokens[token] = None if ttl is None else monotonic() + ttl
+        return token
+
+    def expire_sessions(self) -> None:
+        self._sessions.clear()
+
+    def expire_refresh_tokens(self) -> None:
+        self._refresh_tokens.clear()
+
+    @property
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._faults_middleware])
+        app.add_routes([
+            web.post(f"{API_PATH}prof/authUser", self._auth_user),
+            web.post(f"{API_PATH}cmm/sendOTP", self._send_otp),
+            web.post(f"{API_PATH}cmm/verifyOTP", self._verify_otp),
+            web.get(f"{API_PATH}ownr/gvl", self._session(self._vehicle_list)),
+            web.post(f"{API_PATH}cmm/gvi", self._session(self._vehicle_info)),
+            web.post(f"{API_PATH}cmm/gts", self._session(self._action_status)),
+            web.route("*", f"{API_PATH}rems/rvs", self._command(lambda body: _synced)),
+            web.route("*", f"{API_PATH}rems/door/lock", self._command(lambda body: _door_lock(True))),
+            web.route("*", f"{API_PATH}rems/door/unlock", self._command(lambda body: _door_lock(False))),
+            web.route("*", f"{API_PATH}rems/start", self._command(lambda body: _climate(True, body))),
+            web.route("*", f"{API_PATH}rems/stop", self._command(lambda body: _climate(False, body))),
+            web.route("*", f"{API_PATH}evc/charge", self._command(lambda body: _charging(True))),
+            web.route("*", f"{API_PATH}evc/cancel", self._command(lambda body: _charging(False))),
+            web.route("*", f"{API_PATH}evc/sts", self._command(_charge_limits)),
+        ])
+        return app
+
+    @web.middleware
+    async def _faults_middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        endpoint = request.path.removeprefix(API_PATH)
+        self.stats.requests[endpoint] += 1
+        faults = self.faults
+        if faults.latency_ms:
+            latency = faults.latency_ms
+            if faults.latency_sigma:
+                latency = self._random.lognormvariate(0, faults.latency_sigma) * latency
+            await asyncio.sleep(latency / 1000)
+        if self._burst_left == 0 and self._random.random() < faults.error_rate:
+            self._burst_left = faults.burst_length
+            self._burst_status = self._random.choice(faults.error_statuses)
+        if self._burst_left:
+            self._burst_left -= 1
+            self.stats.http_errors[self._burst_status] += 1
+            headers = {"Retry-After": str(faults.retry_after)} if self._burst_status == 429 else None
+            return web.json_response({"error": "injected"}, status=self._burst_status, headers=headers)
+        return await handler(request)
+
+    @staticmethod
+    def _ok(payload: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> web.Response:
+        return web.json_response(
+            {
+                "status": {"statusCode": 0, "errorType": 0, "errorCode": 0, "errorMessage": "Success with response body"},
+                "payload": payload or {},
+            },
+            headers=headers,
+        )
+
+    @staticmethod
+    def _api_error(error_code: int, message: str) -> web.Response:
+        return web.json_response(
+            {"status": {"statusCode": 1, "errorType": 1, "errorCode": error_code, "errorMessage": message}}
+        )
+
+    def _new_session(self) -> str:
+        session_id = secrets.token_hex(16)
+        self._sessions[session_id] = monotonic() + self.faults.session_ttl
+        return session_id
+
+    def _session(
+            self, handler: Callable[[web.Request], Awaitable[web.Response]]
+    ) -> Callable[[web.Request], Awaitable[web.Response]]:
+        async def with_session(request: web.Request) -> web.Response:
+            expires = self._sessions.get(request.headers.get("sid", ""))
+            if expires is None or expires < monotonic():
+                self.stats.expired_sessions += 1
+                return self._api_error(SESSION_EXPIRED, "Session Key is either invalid or expired")
+            return await handler(request)
+        return with_session
+
+    async def _body(self, request: web.Request) -> dict[str, Any]:
+        if not request.can_read_body:
+            return {}
+        return await request.json()
+
+    def _vehicle(self, request: web.Request, body: dict[str, Any]) -> MockVehicle | None:
+        vehicle_key = request.headers.get("vinkey") or next(iter(body.get("vinKey", [])), None)
+        return self.vehicles.get(vehicle_key)
+
+    async def _auth_user(self, request: web.Request) -> web.Response:
+        self.stats.logins += 1
+        refresh_token = request.headers.get("rmtoken")
+        if refresh_token in self._refresh_tokens:
+            expires = self._refresh_tokens[refresh_token]
+            if expires is None or expires >= monotonic():
+                return self._ok(headers={"sid": self._new_session()})
+            del self._refresh_tokens[refresh_token]
+        otp_key = secrets.token_hex(8)
+        xid = secrets.token_hex(8)
+        self._otp_keys[otp_key] = xid
+        return self._ok(
+            {
+                "otpKey": otp_key,
+                "rmTokenExpired": refresh_token is not None,
+                "hasEmail": True,
+                "hasPhone": True,
+                "email": "m***@example.com",
+                "phone": "***-***-0000",
+            },
+            headers={"xid": xid},
+        )
+
+    async def _send_otp(self, request: web.Request) -> web.Response:
+        if request.headers.get("otpkey") not in self._otp_keys:
+            return self._api_error(SESSION_EXPIRED, "unknown otp key")
+        return self._ok()
+
+    async def _verify_otp(self, request: web.Request) -> web.Response:
+        otp_key = request.headers.get("otpkey")
+        body = await self._body(request)
+        if otp_key not in self._otp_keys:
+            return self._api_error(SESSION_EXPIRED, "unknown otp key")
+        if body.get("otp") != self.faults.otp_code:
+            return self._api_error(1, "invalid otp code")
+        del self._otp_keys[otp_key]
+        self.stats.otp_logins += 1
+        return self._ok(headers={"sid": self._new_session(), "rmtoken": self.issue_refresh_token()})
+
+    async def _vehicle_list(self, request: web.Request) -> web.Response:
+        return self._ok({"vehicleSummary": [vehicle.summary() for vehicle in self.vehicles.values()]})
+
+    async def _vehicle_info(self, request: web.Request) -> web.Response:
+        vehicle = self._vehicle(request, await self._body(request))
+        if vehicle is None:
+            return self._api_error(1, "unknown vehicle")
+        self._settle(vehicle)
+        return self._ok({"vehicleInfoList": [vehicle.payload]})
+
+    async def _action_status(self, request: web.Request) -> web.Response:
+        action = self._actions.get((await self._body(request)).get("xid"))
+        if action is None:
+            return self._api_error(1, "unknown transaction")
+        self._settle(action.vehicle)
+        in_progress = 0 if action.finished(monotonic()) else 1
+        return self._ok({"alertStatus": 0, "remoteStatus": in_progress, "evStatus": 0, "locationStatus": 0})
+
+    def _command(
+            self, effect: Callable[[dict[str, Any]], Callable[[MockVehicle], None]]
+    ) -> Callable[[web.Request], Awaitable[web.Response]]:
+        async def start_action(request: web.Request) -> web.Response:
+            body = await self._body(request)
+            vehicle = self._vehicle(request, body)
+            if vehicle is None:
+                return self._api_error(1, "unknown vehicle")
+            self.stats.actions += 1
+            finishes_at = monotonic() + self.faults.action_seconds
+            if self._random.random() < self.faults.stuck_rate:
+                self.stats.stuck_actions += 1
+                finishes_at = None
+            xid = secrets.token_hex(8)
+            action = MockAction(vehicle=vehicle, apply=effect(body), finishes_at=finishes_at)
+            self._actions[xid] = action
+            self._pending.setdefault(vehicle.vehicle_key, []).append(action)
+            return self._ok(headers={"Xid": xid})
+        return self._session(start_action)
+
+    def _settle(self, vehicle: MockVehicle) -> None:
+        """Apply the finished actions of the vehicle to its replayed status."""
+        now = monotonic()
+        pending = self._pending.get(vehicle.vehicle_key, [])
+        for action in pending:
+            if action.finished(now):
+                action.apply(vehicle)
+                action.applied = True
+        self._pending[vehicle.vehicle_key] = [action for action in pending if not action.applied]
+
+
+async def async_start(
+        cloud: MockKiaCloud, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str]:
+    """Serve the mock cloud, returning the runner and the api url to hand to UsKia."""
+    runner = web.AppRunner(cloud.app)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}{API_PATH}"
+
+
+def point_at(api_connection, api_url: str) -> None:
+    """Send every request of the UsKia connection to the mock cloud."""
+    api_connection.API_URL = api_url
+    api_connection.BASE_URL = api_url.split("//", 1)[1].split("/", 1)[0]
+
+
+def fault_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = FaultConfig()
+    parser.add_argument("--vehicles", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--latency-sigma", type=float, default=defaults.latency_sigma)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--burst-length", type=int, default=defaults.burst_length)
+    parser.add_argument("--error-statuses", type=int, nargs="+", default=list(defaults.error_statuses))
+    parser.add_argument("--action-seconds", type=float, default=defaults.action_seconds)
+    parser.add_argument("--stuck-rate", type=float, default=defaults.stuck_rate)
+    parser.add_argument("--session-ttl", type=float, default=defaults.session_ttl)
+    parser.add_argument("--refresh-token-ttl", type=float, default=defaults.refresh_token_ttl)
+    parser.add_argument("--otp-code", default=defaults.otp_code)
+    parser.add_argument("--seed", type=int)
+
+
+def cloud_from_arguments(args: argparse.Namespace) -> MockKiaCloud:
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        burst_length=args.burst_length,
+        error_statuses=tuple(args.error_statuses),
+        action_seconds=args.action_seconds,
+        stuck_rate=args.stuck_rate,
+        session_ttl=args.session_ttl,
+        refresh_token_ttl=args.refresh_token_ttl,
+        otp_code=args.otp_code,
+    )
+    return MockKiaCloud(build_vehicles(args.vehicles), faults, seed=args.seed)
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    cloud = cloud_from_arguments(args)
+    runner, api_url = await async_start(cloud, args.host, args.port)
+    json.dump({"api_url": api_url, "refresh_token": cloud.issue_refresh_token()}, sys.stdout)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+        json.dump(cloud.stats.as_dict(), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    fault_arguments(parser)
+    args = parser.parse_args()
+    with suppress(KeyboardInterrupt):
+        asyncio.run(async_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Run every benchmark against every recorded payload and write one JSON report.
+
+Run from the repository root with the requirements installed:
+
+    python3 -m benchmarks.run [--payload ev phev ice] [--vehicles 1 10 100] [--output report.json]
+
+Keep the report of a release next to the next one to spot regressions.
+"""
+
+import argparse
+import asyncio
+import platform
+from datetime import datetime, timezone
+from tempfile import TemporaryDirectory
+
+from homeassistant.const import __version__ as HA_VERSION
+
+from . import coordinator, entities, extraction, telemetry
+from .common import PAYLOAD_NAMES, VEHICLE_COUNTS, emit
+from .harness import async_create_hass
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    payloads = {}
+    with TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        try:
+            for payload in args.payload:
+                payloads[payload] = {
+                    "extraction": extraction.run(payload, reads=3, number=args.number * 100)["results"],
+                    **await coordinator.async_run(hass, payload, tuple(args.vehicles), args.number),
+                    "state_writes": await entities.async_run(hass, payload, tuple(args.vehicles), args.number),
+                }
+        finally:
+            await hass.async_stop(force=True)
+    return {
+        "benchmark": "suite",
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "homeassistant": HA_VERSION,
+        "vehicles": args.vehicles,
+        "payloads": payloads,
+        "telemetry": telemetry.run(args.number * 100)["results"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", nargs="+", choices=PAYLOAD_NAMES, default=list(PAYLOAD_NAMES))
+    parser.add_argument("--vehicles", type=int, nargs="+", default=list(VEHICLE_COUNTS))
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+    emit(asyncio.run(async_main(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
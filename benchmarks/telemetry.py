@@ -0,0 +1,57 @@
+"""Time the window queries of a full telemetry buffer.
+
+Run from the repository root with the requirements installed:
+
+    python3 -m benchmarks.telemetry [--number 2000]
+
+Prints one JSON document with the microseconds per query over the last day of
+a buffer filled with 15 minute samples.
+"""
+
+import argparse
+
+from custom_components.ha_kia_hyundai.telemetry import TELEMETRY_FIELDS, TELEMETRY_SIZE, TelemetryBuffer
+
+from .common import best_of, emit
+
+SAMPLE_SECONDS = 900
+WINDOW_SECONDS = 86400
+
+
+def filled_buffer() -> TelemetryBuffer:
+    buffer = TelemetryBuffer()
+    # wrap around once so queries pay for the reordering
+    for sample in range(TELEMETRY_SIZE + TELEMETRY_SIZE // 2):
+        battery = 100 - sample % 80
+        buffer.append(sample * SAMPLE_SECONDS, (battery, 50.0, 10000 + sample, 80, battery * 3, None, battery * 3))
+    return buffer
+
+
+def run(number: int) -> dict:
+    buffer = filled_buffer()
+    queries = {
+        "append": lambda: buffer.append(buffer.last_time + SAMPLE_SECONDS, (1, 2, 3, 4, 5, 6, 7)),
+        "delta": lambda: buffer.delta("ev_battery_level", WINDOW_SECONDS),
+        "slope": lambda: buffer.slope("ev_battery_level", WINDOW_SECONDS),
+        "mean": lambda: buffer.mean("odometer_value", WINDOW_SECONDS),
+        "rolling_mean": lambda: buffer.rolling_mean("ev_battery_level", WINDOW_SECONDS, 4),
+        "as_dict": lambda: buffer.as_dict(WINDOW_SECONDS),
+    }
+    return {
+        "benchmark": "telemetry",
+        "fields": len(TELEMETRY_FIELDS),
+        "capacity": TELEMETRY_SIZE,
+        "window_seconds": WINDOW_SECONDS,
+        "results": {name: {"us_per_call": best_of(query, number) * 1_000_000} for name, query in queries.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+    emit(run(args.number))
+
+
+if __name__ == "__main__":
+    main()
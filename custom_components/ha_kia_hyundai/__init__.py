@@ -1,30 +1,25 @@
 import logging
 
-from datetime import timedelta
-
 from homeassistant.core import HomeAssistant
 from homeassistant.const import (
     CONF_PASSWORD,
     CONF_USERNAME,
-    CONF_SCAN_INTERVAL,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryError
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from kia_hyundai_api import UsKia, AuthError
+from homeassistant.exceptions import ConfigEntryError
+from homeassistant.util import dt as dt_util
 
+from .account import async_get_account, async_release_account
 from .const import (
-    CONF_DEVICE_ID,
-    CONF_REFRESH_TOKEN,
     DOMAIN,
-    PLATFORMS,
     CONF_VEHICLE_ID,
-    DEFAULT_SCAN_INTERVAL,
     CONFIG_FLOW_VERSION,
 )
+from .polling_policy import PollingPolicy
 from .services import async_setup_services, async_unload_services
+from .setup_trace import SetupTrace
 from .vehicle_coordinator import VehicleCoordinator
+from .vehicle_store import VehicleStore
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,76 +47,109 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     return True
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
+    trace = SetupTrace()
     hass.data.setdefault(DOMAIN, {})
     async_setup_services(hass)
 
     vehicle_id = config_entry.data[CONF_VEHICLE_ID]
-    username = config_entry.data[CONF_USERNAME]
-    password = config_entry.data[CONF_PASSWORD]
-    device_id = config_entry.data.get(CONF_DEVICE_ID)
-    refresh_token = config_entry.data.get(CONF_REFRESH_TOKEN)
-
-    scan_interval = timedelta(
-        minutes=config_entry.options.get(
-            CONF_SCAN_INTERVAL,
-            DEFAULT_SCAN_INTERVAL,
-        )
-    )
-
-    client_session = async_get_clientsession(hass)
-    async def otp_callback(context: dict[str, str]):
-        raise ConfigEntryAuthFailed("otp required")
-    api_connection = UsKia(
-        username=username,
-        password=password,
-        client_session=client_session,
-        otp_callback=otp_callback,
-        device_id=device_id,
-        refresh_token=refresh_token,
-    )
+
+    account = async_get_account(hass, config_entry)
+    store = VehicleStore(hass, vehicle_id)
     try:
-        await api_connection.get_vehicles()
-    except AuthError as err:
-        raise ConfigEntryAuthFailed(err) from err
-    coordinator: VehicleCoordinator | None = None
-    if api_connection.vehicles is None:
-        raise ConfigEntryError("no vehicles found")
-    for vehicle in api_connection.vehicles:
-        if vehicle_id == vehicle["vehicleIdentifier"]:
-            coordinator = VehicleCoordinator(
-                hass=hass,
-                config_entry=config_entry,
-                vehicle_id=vehicle["vehicleIdentifier"],
-                vehicle_name=vehicle["nickName"],
-                vehicle_model=vehicle["modelName"],
-                api_connection=api_connection,
-                scan_interval=scan_interval,
+        with trace.phase("load_store"):
+            stored = await store.async_load()
+        if stored is not None:
+            vehicle_name = stored["vehicle_name"]
+            vehicle_model = stored["vehicle_model"]
+        else:
+            with trace.phase("get_vehicles"):
+                vehicles = await account.async_get_vehicles()
+            vehicle = next(
+                (
+                    vehicle
+                    for vehicle in vehicles
+                    if vehicle_id == vehicle["vehicleIdentifier"]
+                ),
+                None,
             )
-    if coordinator is None:
-        raise ConfigEntryError("vehicle not found")
-    _LOGGER.debug("first update start")
-    await coordinator.async_config_entry_first_refresh()
-    _LOGGER.debug("first update finished")
+            if vehicle is None:
+                raise ConfigEntryError("vehicle not found")
+            vehicle_name = vehicle["nickName"]
+            vehicle_model = vehicle["modelName"]
+        coordinator = VehicleCoordinator(
+            hass=hass,
+            config_entry=config_entry,
+            vehicle_id=vehicle_id,
+            vehicle_name=vehicle_name,
+            vehicle_model=vehicle_model,
+            api_connection=account.vehicle(vehicle_id),
+            polling_policy=PollingPolicy.from_options(config_entry.options),
+            store=store,
+            setup_trace=trace,
+        )
+        if stored is not None:
+            _LOGGER.debug("starting from last known payload, first update in background")
+            with trace.phase("restore"):
+                refreshed_at = stored.get("refreshed_at")
+                coordinator.async_restore(
+                    stored["data"],
+                    stored.get("capabilities"),
+                    dt_util.parse_datetime(refreshed_at) if refreshed_at is not None else None,
+                )
+            config_entry.async_create_background_task(
+                hass,
+                _async_traced_refresh(coordinator, trace),
+                name=f"{DOMAIN}-{vehicle_id}-first-refresh",
+            )
+        else:
+            _LOGGER.debug("first update start")
+            with trace.phase("first_refresh"):
+                await coordinator.async_config_entry_first_refresh()
+            _LOGGER.debug("first update finished")
+    except Exception:
+        await async_release_account(hass, config_entry, account)
+        raise
 
     hass.data[DOMAIN][vehicle_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    coordinator.loaded_capabilities = coordinator.capabilities
+    coordinator.platforms = coordinator.capabilities.platforms
+    _LOGGER.debug(f"forwarding platforms {coordinator.platforms}")
+    with trace.phase("forward_entry_setups"):
+        await hass.config_entries.async_forward_entry_setups(config_entry, coordinator.platforms)
 
     if not config_entry.update_listeners:
         config_entry.add_update_listener(async_update_options)
 
+    trace.finish()
+    _LOGGER.debug(f"setup of {coordinator.vehicle_name} took {trace.summary()}")
     return True
 
+async def _async_traced_refresh(coordinator: VehicleCoordinator, trace: SetupTrace) -> None:
+    """First refresh after a restore, it runs after the setup finished."""
+    with trace.phase("background_first_refresh"):
+        await coordinator.async_refresh()
+
 async def async_update_options(hass: HomeAssistant, config_entry: ConfigEntry):
+    coordinator: VehicleCoordinator | None = hass.data[DOMAIN].get(config_entry.unique_id)
+    if coordinator is not None and coordinator.entry_options == config_entry.options:
+        # only the data changed, e.g. rotated tokens written back, nothing to reload
+        return
     await hass.config_entries.async_reload(config_entry.entry_id)
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry):
+    await VehicleStore(hass, config_entry.data[CONF_VEHICLE_ID]).async_remove()
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
+    vehicle_id = config_entry.unique_id
+    coordinator: VehicleCoordinator = hass.data[DOMAIN][vehicle_id]
     if unload_ok :=  await hass.config_entries.async_unload_platforms(
-        config_entry, PLATFORMS
+        config_entry, coordinator.platforms
     ):
-        vehicle_id = config_entry.unique_id
-        await hass.data[DOMAIN][vehicle_id].api_connection.api_session.close()
         del hass.data[DOMAIN][vehicle_id]
+        # a reload starts from the stored payload and capabilities
+        await coordinator.store.async_flush()
+        await async_release_account(hass, config_entry, coordinator.api_connection.account)
     if not hass.data[DOMAIN]:
         async_unload_services(hass)
     return unload_ok
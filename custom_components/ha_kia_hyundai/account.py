@@ -0,0 +1,378 @@
+"""Account scoped api connection shared by every vehicle config entry of a login."""
+
+from asyncio import Event, Lock, wait_for
+from hashlib import sha256
+from collections.abc import Mapping
+from contextlib import suppress
+from datetime import datetime
+from logging import getLogger
+from time import monotonic
+from typing import Any, Final
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from aiohttp import ClientError
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryError, HomeAssistantError
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_call_later
+from kia_hyundai_api import UsKia, AuthError
+
+from .api_metrics import ApiMetrics
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .const import (
+    CONF_DEVICE_ID,
+    CONF_RATE_LIMIT_BURST,
+    CONF_RATE_LIMIT_PER_MINUTE,
+    CONF_REFRESH_TOKEN,
+    CONF_VEHICLE_ID,
+    DATA_ACCOUNTS,
+    DATA_PENDING_LOGINS,
+    DOMAIN,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_RATE_LIMIT_PER_MINUTE,
+)
+from .rate_limiter import Priority, RateLimiter
+from .session_manager import AccountSession
+from .token_writer import TokenWriter
+
+_LOGGER = getLogger(__name__)
+
+# seconds a command waits for the action another vehicle of the account has in progress
+ACTION_WAIT_TIMEOUT: Final = 60
+# an action not reported finished by then no longer blocks the other vehicles
+ACTION_HOLD_TIMEOUT: Final = 300
+# seconds a login handed over by the config flow waits for its entry setup before it is closed
+PENDING_LOGIN_TIMEOUT: Final = 600
+# errors of the connection itself, anything the cloud answered with counts as reachable
+TRANSPORT_ERRORS: Final = (ClientError, TimeoutError)
+
+
+class KiaAccount:
+    """One UsKia login, its tokens and vehicle list for all entries of a username."""
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            username: str,
+            password: str,
+            device_id: str | None,
+            refresh_token: str | None,
+            api_connection: UsKia | None = None,
+            session: AccountSession | None = None,
+    ) -> None:
+        self.username: str = username
+        self.password: str = password
+        self.entry_ids: set[str] = set()
+        # UsKia tracks a single action, one vehicle at a time may have one in progress
+        self.last_action_vehicle_id: str | None = None
+        self._action_started: float = 0
+        self._action_released = Event()
+        self._action_released.set()
+        self._vehicles_lock = Lock()
+        self._rate_limits: dict[str, tuple[int, int]] = {}
+        self.rate_limiter: RateLimiter = RateLimiter(DEFAULT_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_PER_MINUTE)
+        self.circuit_breaker: CircuitBreaker = CircuitBreaker(self._async_circuit_changed)
+        self._issue_id: str = f"cloud_unavailable_{sha256(username.encode()).hexdigest()[:12]}"
+
+        async def otp_callback(context: dict[str, str]):
+            raise ConfigEntryAuthFailed("otp required")
+
+        self._hass: HomeAssistant = hass
+        if api_connection is None or session is None:
+            session = AccountSession(hass)
+            api_connection = UsKia(
+                username=username,
+                password=password,
+                client_session=session.client_session,
+                otp_callback=otp_callback,
+                device_id=device_id,
+                refresh_token=refresh_token,
+            )
+        self.session: AccountSession = session
+        self.api_connection: UsKia = api_connection
+        self.token_writer: TokenWriter = TokenWriter(hass, self, refresh_token, device_id)
+
+    async def async_get_vehicles(self) -> list[dict[str, Any]]:
+        """Login and fetch the vehicle list once, concurrent callers share the result."""
+        async with self._vehicles_lock:
+            if self.api_connection.vehicles is None:
+                _LOGGER.debug(f"fetching vehicles for account with {len(self.entry_ids)} entries")
+                self.circuit_breaker.before_call()
+                await self.rate_limiter.acquire(Priority.POLL)
+                try:
+                    with self.session.in_use():
+                        await self.api_connection.get_vehicles()
+                except TRANSPORT_ERRORS as err:
+                    self.circuit_breaker.record_failure(err)
+                    raise
+                except AuthError as err:
+                    self.circuit_breaker.record_success()
+                    raise ConfigEntryAuthFailed(err) from err
+                except Exception:
+                    self.circuit_breaker.record_success()
+                    raise
+                finally:
+                    self.token_writer.async_check()
+                self.circuit_breaker.record_success()
+        if self.api_connection.vehicles is None:
+            raise ConfigEntryError("no vehicles found")
+        return self.api_connection.vehicles
+
+    async def async_acquire_action(self, vehicle_id: str) -> None:
+        """Wait until no other vehicle of the account has an action in progress."""
+        deadline = monotonic() + ACTION_WAIT_TIMEOUT
+        while self.last_action_vehicle_id not in (None, vehicle_id):
+            held = monotonic() - self._action_started
+            if held > ACTION_HOLD_TIMEOUT:
+                _LOGGER.warning(
+                    f"action of vehicle {self.last_action_vehicle_id} not finished after {ACTION_HOLD_TIMEOUT}s, "
+                    "no longer waiting for it"
+                )
+                break
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise HomeAssistantError(
+                    f"another vehicle of {self.username} has an action in progress, try again once it finished"
+                )
+            _LOGGER.debug(f"waiting for the action of vehicle {self.last_action_vehicle_id} to finish")
+            with suppress(TimeoutError):
+                await wait_for(self._action_released.wait(), min(remaining, ACTION_HOLD_TIMEOUT - held))
+            # another waiter may have taken it meanwhile, check again
+        self.last_action_vehicle_id = vehicle_id
+        self._action_started = monotonic()
+        self._action_released.clear()
+
+    def release_action(self, vehicle_id: str) -> None:
+        """Let the other vehicles send actions once the action of this one finished."""
+        if self.last_action_vehicle_id == vehicle_id:
+            self.last_action_vehicle_id = None
+            self._action_released.set()
+
+    def set_rate_limits(self, entry_id: str, options: Mapping[str, Any]) -> None:
+        """Apply the strictest limits configured by the entries of the account."""
+        self._rate_limits[entry_id] = (
+            options.get(CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST),
+            options.get(CONF_RATE_LIMIT_PER_MINUTE, DEFAULT_RATE_LIMIT_PER_MINUTE),
+        )
+        self._apply_rate_limits()
+
+    def release_rate_limits(self, entry_id: str) -> None:
+        self._rate_limits.pop(entry_id, None)
+        if self._rate_limits:
+            self._apply_rate_limits()
+
+    def _apply_rate_limits(self) -> None:
+        self.rate_limiter.configure(
+            burst=min(burst for burst, _ in self._rate_limits.values()),
+            per_minute=min(per_minute for _, per_minute in self._rate_limits.values()),
+        )
+
+    @callback
+    def _async_circuit_changed(self, circuit_breaker: CircuitBreaker) -> None:
+        """Show a repair issue while the circuit is open."""
+        if circuit_breaker.state == CircuitState.CLOSED:
+            ir.async_delete_issue(self._hass, DOMAIN, self._issue_id)
+        elif circuit_breaker.state == CircuitState.OPEN:
+            ir.async_create_issue(
+                self._hass,
+                DOMAIN,
+                self._issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key="cloud_unavailable",
+                translation_placeholders={
+                    "username": self.username,
+                    "failures": str(circuit_breaker.failures),
+                    "retry_in": str(round(circuit_breaker.retry_in)),
+                    "error": circuit_breaker.last_error or "",
+                },
+            )
+
+    def use_connection(self, api_connection: UsKia, session: AccountSession) -> None:
+        """Continue with a fresh login, e.g. from a reauth flow."""
+        previous_session = self.session
+        self.api_connection = api_connection
+        self.session = session
+        self.token_writer.async_check()
+        # calls of other vehicles may still run on the previous connection
+        previous_session.async_close_when_idle()
+
+    def vehicle(self, vehicle_id: str) -> "VehicleConnection":
+        return VehicleConnection(self, vehicle_id)
+
+    async def async_close(self) -> None:
+        ir.async_delete_issue(self._hass, DOMAIN, self._issue_id)
+        self.token_writer.async_close()
+        await self.session.async_close()
+
+
+class VehicleConnection:
+    """Per vehicle view of the shared account connection."""
+
+    def __init__(self, account: KiaAccount, vehicle_id: str) -> None:
+        self.account: KiaAccount = account
+        self.vehicle_id: str = vehicle_id
+        self.metrics: ApiMetrics = ApiMetrics()
+
+    @property
+    def last_action(self) -> dict[str, Any] | None:
+        """Return the in progress action, if this vehicle started it."""
+        if self.account.last_action_vehicle_id == self.vehicle_id:
+            return self.account.api_connection.last_action
+        return None
+
+    async def _call(self, method: str, priority: Priority, **kwargs: Any) -> Any:
+        circuit_breaker = self.account.circuit_breaker
+        circuit_breaker.before_call()
+        await self.account.rate_limiter.acquire(priority)
+        # a new login may replace the connection while the call runs
+        session, api_connection = self.account.session, self.account.api_connection
+        start = monotonic()
+        try:
+            with session.in_use():
+                result = await getattr(api_connection, method)(vehicle_id=self.vehicle_id, **kwargs)
+        except Exception as err:
+            self.metrics.record_call(method, (monotonic() - start) * 1000, err)
+            if isinstance(err, TRANSPORT_ERRORS):
+                circuit_breaker.record_failure(err)
+            else:
+                circuit_breaker.record_success()
+            raise
+        finally:
+            self.account.token_writer.async_check()
+        self.metrics.record_call(method, (monotonic() - start) * 1000)
+        circuit_breaker.record_success()
+        return result
+
+    async def _action(self, method: str, **kwargs: Any) -> Any:
+        """Send the command, the account stays reserved until the action is reported finished."""
+        await self.account.async_acquire_action(self.vehicle_id)
+        try:
+            result = await self._call(method, Priority.COMMAND, **kwargs)
+        except BaseException:
+            self.account.release_action(self.vehicle_id)
+            raise
+        self._release_finished_action()
+        return result
+
+    def _release_finished_action(self) -> None:
+        if self.account.api_connection.last_action is None:
+            self.account.release_action(self.vehicle_id)
+
+    async def get_cached_vehicle_status(self) -> dict[str, Any]:
+        await self.account.async_get_vehicles()
+        return await self._call("get_cached_vehicle_status", Priority.POLL)
+
+    async def check_last_action_finished(self) -> None:
+        if self.last_action is not None:
+            try:
+                await self._call("check_last_action_finished", Priority.ACTION_CHECK)
+            finally:
+                self._release_finished_action()
+
+    async def request_vehicle_data_sync(self) -> None:
+        await self._action("request_vehicle_data_sync")
+
+    async def lock(self) -> None:
+        await self._action("lock")
+
+    async def unlock(self) -> None:
+        await self._action("unlock")
+
+    async def start_climate(self, **kwargs: Any) -> None:
+        await self._action("start_climate", **kwargs)
+
+    async def stop_climate(self) -> None:
+        await self._action("stop_climate")
+
+    async def start_charge(self) -> None:
+        await self._action("start_charge")
+
+    async def stop_charge(self) -> None:
+        await self._action("stop_charge")
+
+    async def set_charge_limits(self, ac_limit: int, dc_limit: int) -> None:
+        await self._action("set_charge_limits", ac_limit=ac_limit, dc_limit=dc_limit)
+
+
+@callback
+def async_hand_off_login(
+        hass: HomeAssistant,
+        username: str,
+        password: str,
+        api_connection: UsKia,
+        session: AccountSession,
+) -> None:
+    """Keep the logged in connection of a config flow for the setup of its entry."""
+    pending: dict[str, tuple[str, UsKia, AccountSession, CALLBACK_TYPE]] = hass.data.setdefault(DATA_PENDING_LOGINS, {})
+    previous = pending.pop(username, None)
+    if previous is not None:
+        previous[3]()
+        hass.async_create_task(previous[2].async_close())
+
+    @callback
+    def _async_expire(_now: datetime) -> None:
+        # the flow was abandoned or its entry never set up
+        if username in pending and pending[username][2] is session:
+            _LOGGER.debug("closing config flow login that was never used")
+            del pending[username]
+            hass.async_create_task(session.async_close())
+
+    pending[username] = (password, api_connection, session, async_call_later(hass, PENDING_LOGIN_TIMEOUT, _async_expire))
+
+
+def _async_take_login(hass: HomeAssistant, username: str, password: str) -> tuple[UsKia, AccountSession] | None:
+    pending: dict[str, tuple[str, UsKia, AccountSession, CALLBACK_TYPE]] = hass.data.get(DATA_PENDING_LOGINS, {})
+    login = pending.pop(username, None)
+    if login is None:
+        return None
+    login_password, api_connection, session, cancel_expiry = login
+    cancel_expiry()
+    if login_password != password:
+        hass.async_create_task(session.async_close())
+        return None
+    return api_connection, session
+
+
+def async_get_account(hass: HomeAssistant, config_entry: ConfigEntry) -> KiaAccount:
+    """Return the shared account for the entry's username, creating it on first use."""
+    accounts: dict[str, KiaAccount] = hass.data.setdefault(DATA_ACCOUNTS, {})
+    username = config_entry.data[CONF_USERNAME]
+    password = config_entry.data[CONF_PASSWORD]
+    account = accounts.get(username)
+    login = _async_take_login(hass, username, password)
+    api_connection, session = login if login is not None else (None, None)
+    if account is None or account.password != password:
+        _LOGGER.debug(f"creating shared account connection, reusing config flow login: {login is not None}")
+        account = KiaAccount(
+            hass,
+            username=username,
+            password=password,
+            device_id=config_entry.data.get(CONF_DEVICE_ID),
+            refresh_token=config_entry.data.get(CONF_REFRESH_TOKEN),
+            api_connection=api_connection,
+            session=session,
+        )
+        accounts[username] = account
+    elif login is not None:
+        _LOGGER.debug("reusing config flow login for shared account connection")
+        account.use_connection(api_connection, session)
+    account.entry_ids.add(config_entry.entry_id)
+    account.set_rate_limits(config_entry.entry_id, config_entry.options)
+    return account
+
+
+async def async_release_account(hass: HomeAssistant, config_entry: ConfigEntry, account: KiaAccount) -> None:
+    """Drop the entry from the account, closing it once no entry uses it."""
+    # a rotation still waiting to be written must reach this entry too, it starts from its data
+    account.token_writer.async_flush()
+    account.entry_ids.discard(config_entry.entry_id)
+    account.release_action(config_entry.data[CONF_VEHICLE_ID])
+    if account.entry_ids:
+        account.release_rate_limits(config_entry.entry_id)
+        return
+    accounts: dict[str, KiaAccount] = hass.data.get(DATA_ACCOUNTS, {})
+    if accounts.get(account.username) is account:
+        del accounts[account.username]
+    await account.async_close()
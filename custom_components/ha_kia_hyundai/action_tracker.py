@@ -0,0 +1,75 @@
+"""Follow an in progress remote action without holding up the coordinator refresh."""
+
+from asyncio import Task, sleep, wait
+from logging import getLogger
+from typing import TYPE_CHECKING, Final
+
+from aiohttp import ClientError
+from homeassistant.core import callback
+
+from .circuit_breaker import CircuitOpenError, backoff_delay
+from .const import DELAY_BETWEEN_ACTION_IN_PROGRESS_CHECKING, DOMAIN
+
+if TYPE_CHECKING:
+    from .vehicle_coordinator import VehicleCoordinator
+
+_LOGGER = getLogger(__name__)
+
+# longest pause between action checks while they keep failing
+MAX_CHECK_BACKOFF: Final = 300
+
+
+class ActionTracker:
+    """Poll the action status on its own schedule and refresh once it finishes."""
+
+    def __init__(self, coordinator: "VehicleCoordinator") -> None:
+        self._coordinator = coordinator
+        self._task: Task | None = None
+
+    @property
+    def tracking(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @callback
+    def async_track(self) -> None:
+        """Start watching the last action, a running watcher picks up new actions itself."""
+        if self.tracking:
+            return
+        coordinator = self._coordinator
+        self._task = coordinator.config_entry.async_create_background_task(
+            coordinator.hass,
+            self._async_watch(),
+            name=f"{DOMAIN}-{coordinator.vehicle_id}-action-tracker",
+        )
+
+    async def async_wait(self, timeout: float) -> bool:
+        """Wait for the tracked action and its refresh, return false on timeout."""
+        if not self.tracking:
+            return True
+        done, _ = await wait((self._task,), timeout=timeout)
+        return bool(done)
+
+    async def _async_watch(self) -> None:
+        coordinator = self._coordinator
+        api_connection = coordinator.api_connection
+        failures = 0
+        while coordinator.last_action_name is not None:
+            delay = DELAY_BETWEEN_ACTION_IN_PROGRESS_CHECKING
+            try:
+                await api_connection.check_last_action_finished()
+                failures = 0
+            except CircuitOpenError as err:
+                _LOGGER.debug(err)
+                delay = max(delay, api_connection.account.circuit_breaker.retry_in)
+            except (ClientError, TimeoutError) as err:
+                failures += 1
+                delay = backoff_delay(DELAY_BETWEEN_ACTION_IN_PROGRESS_CHECKING, failures, MAX_CHECK_BACKOFF)
+                _LOGGER.error(f"checking action failed {failures} times, next check in {delay:.0f}s: {err}")
+            if coordinator.last_action_name is not None:
+                _LOGGER.debug(f"action still in progress {api_connection.last_action}")
+                await sleep(delay)
+        _LOGGER.debug("action finished, refreshing vehicle status")
+        # the refresh now confirms or reverts the expected outcome of the sent commands
+        coordinator.optimistic.settle()
+        coordinator.async_notify_fields(("last_action_name",))
+        await coordinator.async_request_refresh()
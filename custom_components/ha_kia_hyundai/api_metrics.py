@@ -0,0 +1,118 @@
+"""Latency histograms, error counts and payload sizes of the api calls of one vehicle."""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Final
+
+# coordinator field notified after each refresh so the diagnostic sensors update
+METRICS_FIELD: Final = "api_metrics"
+# upper bounds of the histogram buckets, in milliseconds
+BUCKETS_MS: Final = (25, 50, 100, 250, 500, 750, 1000, 1500, 2000, 3000, 5000, 7500, 10000, 15000, 20000, 30000, 60000)
+STATUS_METHOD: Final = "get_cached_vehicle_status"
+ACTION_CHECK_METHOD: Final = "check_last_action_finished"
+COMMAND_METHODS: Final = frozenset({
+    "request_vehicle_data_sync",
+    "lock",
+    "unlock",
+    "start_climate",
+    "stop_climate",
+    "start_charge",
+    "stop_charge",
+    "set_charge_limits",
+})
+
+
+class LatencyHistogram:
+    """Fixed bucket histogram, percentiles are interpolated within a bucket."""
+
+    __slots__ = ("counts", "count", "maximum")
+
+    def __init__(self) -> None:
+        # the last bucket collects everything above the largest bound
+        self.counts: list[int] = [0] * (len(BUCKETS_MS) + 1)
+        self.count: int = 0
+        self.maximum: float = 0
+
+    def record(self, duration_ms: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.maximum = max(self.maximum, duration_ms)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        merged = LatencyHistogram()
+        merged.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        merged.count = self.count + other.count
+        merged.maximum = max(self.maximum, other.maximum)
+        return merged
+
+    def percentile(self, fraction: float) -> float | None:
+        if self.count == 0:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= target:
+                lower = BUCKETS_MS[index - 1] if index else 0
+                upper = BUCKETS_MS[index] if index < len(BUCKETS_MS) else self.maximum
+                return round(min(lower + (upper - lower) * (target - seen) / bucket_count, self.maximum))
+            seen += bucket_count
+        return round(self.maximum)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.maximum),
+        }
+
+
+class ApiMetrics:
+    """Everything measured around the api calls of one vehicle since setup."""
+
+    def __init__(self) -> None:
+        self.latency: dict[str, LatencyHistogram] = {}
+        self.errors: Counter[str] = Counter()
+        self.last_error: str | None = None
+        self.payload_bytes: int | None = None
+        self.refresh: LatencyHistogram = LatencyHistogram()
+        self.last_refresh_ms: float | None = None
+
+    def record_call(self, method: str, duration_ms: float, error: Exception | None = None) -> None:
+        histogram = self.latency.get(method)
+        if histogram is None:
+            histogram = self.latency[method] = LatencyHistogram()
+        histogram.record(duration_ms)
+        if error is not None:
+            self.errors[method] += 1
+            self.last_error = f"{method}: {type(error).__name__} {error}"
+
+    def record_refresh(self, duration_ms: float, payload_bytes: int) -> None:
+        self.refresh.record(duration_ms)
+        self.last_refresh_ms = round(duration_ms)
+        self.payload_bytes = payload_bytes
+
+    def method_latency(self, method: str) -> LatencyHistogram:
+        return self.latency.get(method) or LatencyHistogram()
+
+    def commands_latency(self) -> LatencyHistogram:
+        merged = LatencyHistogram()
+        for method, histogram in self.latency.items():
+            if method in COMMAND_METHODS:
+                merged = merged.merge(histogram)
+        return merged
+
+    @property
+    def error_count(self) -> int:
+        return self.errors.total()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "latency": {method: histogram.as_dict() for method, histogram in self.latency.items()},
+            "errors": dict(self.errors),
+            "last_error": self.last_error,
+            "payload_bytes": self.payload_bytes,
+            "refresh": self.refresh.as_dict(),
+            "last_refresh_ms": self.last_refresh_ms,
+        }
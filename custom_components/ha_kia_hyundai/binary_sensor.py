@@ -14,6 +14,7 @@ from .const import (
     CONF_VEHICLE_ID,
 )
 from .vehicle_coordinator_base_entity import VehicleCoordinatorBaseEntity
+from .setup_trace import traced_platform_setup
 
 _LOGGER = getLogger(__name__)
 PARALLEL_UPDATES: int = 1
@@ -135,6 +136,7 @@ BINARY_SENSOR_DESCRIPTIONS: Final[tuple[KiaBinarySensorEntityDescription, ...]]
     ),
 )
 
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
@@ -143,7 +145,7 @@ async def async_setup_entry(
 
     binary_sensors = []
     for description in BINARY_SENSOR_DESCRIPTIONS:
-        if getattr(coordinator, description.key) is not None:
+        if coordinator.capabilities.has(description.key):
             binary_sensors.append(
                 InstrumentSensor(
                     coordinator=coordinator,
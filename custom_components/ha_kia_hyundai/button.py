@@ -11,11 +11,14 @@ from .const import (
     CONF_VEHICLE_ID,
 )
 from .vehicle_coordinator_base_entity import VehicleCoordinatorBaseEntity
+from .wake_budget import DEFAULT_MAX_AGE
+from .setup_trace import traced_platform_setup
 
 _LOGGER = getLogger(__name__)
 PARALLEL_UPDATES: int = 1
 
 
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
@@ -28,6 +31,8 @@ async def async_setup_entry(
 
 
 class RequestUpdateFromCarButton(VehicleCoordinatorBaseEntity, ButtonEntity):
+    coordinator_fields = frozenset()
+
     def __init__(
             self,
             coordinator: VehicleCoordinator,
@@ -39,7 +44,6 @@ class RequestUpdateFromCarButton(VehicleCoordinatorBaseEntity, ButtonEntity):
         ))
 
     async def async_press(self) -> None:
-        """Press the button."""
-        await self.coordinator.api_connection.request_vehicle_data_sync(vehicle_id=self.coordinator.vehicle_id)
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
+        """Wake the car unless the cloud already has recent data."""
+        result = await self.coordinator.wake_budget.async_refresh(DEFAULT_MAX_AGE)
+        _LOGGER.debug(f"requested update from car: {result}")
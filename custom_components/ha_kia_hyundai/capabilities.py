@@ -0,0 +1,72 @@
+"""Per vehicle capability profile deciding which platforms and entities to load."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.const import Platform
+
+from .const import PLATFORMS
+from .vehicle_snapshot import FIELD_NAMES, VehicleSnapshot
+
+
+@dataclass(frozen=True)
+class CapabilityProfile:
+    """What the vehicle supports and which fields it has ever reported."""
+
+    remote_lock: bool = False
+    remote_climate: bool = False
+    climate_seats: bool = False
+    fields: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: VehicleSnapshot) -> "CapabilityProfile":
+        return cls(
+            remote_lock=bool(snapshot.can_remote_lock),
+            remote_climate=bool(snapshot.can_remote_climate),
+            climate_seats=bool(snapshot.has_climate_seats),
+            fields=frozenset(name for name in FIELD_NAMES if getattr(snapshot, name) is not None),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CapabilityProfile":
+        return cls(
+            remote_lock=data["remote_lock"],
+            remote_climate=data["remote_climate"],
+            climate_seats=data["climate_seats"],
+            fields=frozenset(data["fields"]),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "remote_lock": self.remote_lock,
+            "remote_climate": self.remote_climate,
+            "climate_seats": self.climate_seats,
+            "fields": sorted(self.fields),
+        }
+
+    def merge(self, other: "CapabilityProfile") -> "CapabilityProfile":
+        """Return the union, a field reported once keeps its entity."""
+        return CapabilityProfile(
+            remote_lock=self.remote_lock or other.remote_lock,
+            remote_climate=self.remote_climate or other.remote_climate,
+            climate_seats=self.climate_seats or other.climate_seats,
+            fields=self.fields | other.fields,
+        )
+
+    def has(self, field: str) -> bool:
+        return field in self.fields
+
+    @property
+    def platforms(self) -> list[Platform]:
+        needed = {
+            Platform.BINARY_SENSOR: True,
+            Platform.BUTTON: True,
+            Platform.CLIMATE: self.remote_climate,
+            Platform.DEVICE_TRACKER: self.has("latitude") and self.has("longitude"),
+            Platform.LOCK: self.remote_lock,
+            Platform.NUMBER: self.has("ev_charge_limits_ac") or self.has("ev_charge_limits_dc"),
+            Platform.SELECT: self.climate_seats,
+            Platform.SENSOR: True,
+            Platform.SWITCH: self.remote_climate or self.has("ev_plugged_in"),
+        }
+        return [platform for platform in PLATFORMS if needed[platform]]
@@ -0,0 +1,72 @@
+"""Charge rate estimated from the battery levels reported while charging."""
+
+from typing import Final
+
+# seconds after which a new rate sample outweighs the estimate
+RATE_HALF_LIFE: Final = 1800
+# batteryPlugin of a DC fast charger, AC chargers report 2 or 3
+PLUG_TYPE_DC: Final = 1
+SECONDS_PER_HOUR: Final = 3600
+
+
+class ChargeRateEstimator:
+    """Exponentially weighted charge rate in %/h, updated incrementally per reported level.
+
+    The level is reported in whole percent, so a rate sample is taken from one
+    level change to the next instead of from poll to poll.
+    """
+
+    def __init__(self, half_life: float = RATE_HALF_LIFE) -> None:
+        self._half_life: float = half_life
+        self.rate: float | None = None
+        # time and level of the last level change
+        self._anchor: tuple[float, int] | None = None
+        # time of the last sample blended into the rate
+        self._sampled_at: float | None = None
+
+    def update(self, timestamp: float | None, level: int | None, charging: bool | None) -> bool:
+        """Feed the latest reported sample, return true if the rate changed."""
+        previous = self.rate
+        if not charging or timestamp is None or level is None:
+            self.rate = None
+            self._anchor = None
+            self._sampled_at = None
+            return previous is not None
+        if self._anchor is None:
+            self._anchor = (timestamp, level)
+            self._sampled_at = timestamp
+            return False
+        anchor_time, anchor_level = self._anchor
+        elapsed = timestamp - anchor_time
+        if elapsed <= 0:
+            return False
+        if level > anchor_level:
+            self._blend((level - anchor_level) / elapsed * SECONDS_PER_HOUR, timestamp - self._sampled_at)
+            self._anchor = (timestamp, level)
+            self._sampled_at = timestamp
+        elif level < anchor_level:
+            # level recalibrated by the vehicle, start over from here
+            self._anchor = (timestamp, level)
+            self._sampled_at = timestamp
+        elif self.rate is not None and self.rate * elapsed / SECONDS_PER_HOUR > 1:
+            # no percent gained for longer than the estimate allows, the rate is at most one percent since,
+            # weighted by the time since the previous sample so a stall is not counted again every poll
+            self._blend(SECONDS_PER_HOUR / elapsed, timestamp - self._sampled_at)
+            self._sampled_at = timestamp
+        return self.rate != previous
+
+    def _blend(self, sample: float, elapsed: float) -> None:
+        if self.rate is None:
+            self.rate = sample
+            return
+        weight = 1 - 0.5 ** (elapsed / self._half_life)
+        self.rate += weight * (sample - self.rate)
+
+
+def minutes_to_target(level: int | None, target: int | None, rate: float | None) -> int | None:
+    """Return the minutes until the level reaches the target at the rate."""
+    if level is None or target is None or not rate:
+        return None
+    if level >= target:
+        return 0
+    return round((target - level) / rate * 60)
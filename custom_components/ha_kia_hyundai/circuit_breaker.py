@@ -0,0 +1,111 @@
+"""Stop calling the cloud while it is down and probe it with growing pauses."""
+
+import random
+from collections.abc import Callable
+from enum import StrEnum
+from logging import getLogger
+from time import monotonic
+from typing import Any, Final
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+_LOGGER = getLogger(__name__)
+
+# consecutive transport failures that open the circuit
+FAILURE_THRESHOLD: Final = 5
+BASE_BACKOFF: Final = 30
+MAX_BACKOFF: Final = 1800
+JITTER: Final = 0.2
+# a probe that neither succeeded nor failed by then, e.g. cancelled, no longer blocks the next
+PROBE_TIMEOUT: Final = 120
+
+
+def backoff_delay(base: float, attempt: int, maximum: float) -> float:
+    """Return base doubled per attempt up to the maximum, spread by the jitter."""
+    delay = min(maximum, base * 2 ** max(0, attempt - 1))
+    return delay * random.uniform(1 - JITTER, 1 + JITTER)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(UpdateFailed):
+    """The cloud failed repeatedly, calls are paused until the next probe."""
+
+
+class CircuitBreaker:
+    """Closed passes every call, open rejects them until a single half open probe may try again."""
+
+    def __init__(
+            self,
+            on_change: Callable[["CircuitBreaker"], None] | None = None,
+            failure_threshold: int = FAILURE_THRESHOLD,
+    ) -> None:
+        self.state: CircuitState = CircuitState.CLOSED
+        self.failures: int = 0
+        # openings since the last success, each one doubles the pause
+        self.openings: int = 0
+        self.last_error: str | None = None
+        self._retry_at: float = 0
+        self._probe_started: float | None = None
+        self._failure_threshold: int = failure_threshold
+        self._on_change = on_change
+
+    @property
+    def retry_in(self) -> float:
+        return max(0.0, self._retry_at - monotonic())
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless the call may go to the cloud."""
+        if self.state == CircuitState.CLOSED:
+            return
+        if self.state == CircuitState.OPEN and self.retry_in == 0:
+            _LOGGER.debug("circuit half open, probing the cloud")
+            self._set_state(CircuitState.HALF_OPEN)
+        if self.state == CircuitState.HALF_OPEN and (
+            self._probe_started is None or monotonic() - self._probe_started > PROBE_TIMEOUT
+        ):
+            self._probe_started = monotonic()
+            return
+        raise CircuitOpenError(f"cloud calls paused for {self.retry_in:.0f}s after {self.failures} failures")
+
+    def record_success(self) -> None:
+        self._probe_started = None
+        self.failures = 0
+        self.openings = 0
+        if self.state != CircuitState.CLOSED:
+            _LOGGER.info("cloud reachable again, circuit closed")
+            self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self, error: Exception) -> None:
+        self._probe_started = None
+        self.failures += 1
+        self.last_error = f"{type(error).__name__} {error}"
+        if self.state == CircuitState.OPEN:
+            # a call started before the circuit opened
+            return
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self._failure_threshold:
+            self.openings += 1
+            delay = backoff_delay(BASE_BACKOFF, self.openings, MAX_BACKOFF)
+            self._retry_at = monotonic() + delay
+            _LOGGER.warning(f"circuit open after {self.failures} failures, next try in {delay:.0f}s: {self.last_error}")
+            self._set_state(CircuitState.OPEN)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "openings": self.openings,
+            "retry_in": round(self.retry_in),
+            "last_error": self.last_error,
+        }
+
+    def _set_state(self, state: CircuitState) -> None:
+        changed = state != self.state
+        self.state = state
+        # re-openings are reported too, the pause grew
+        if (changed or state == CircuitState.OPEN) and self._on_change is not None:
+            self._on_change(self)
@@ -26,6 +26,7 @@ from .const import (
     TEMPERATURE_MIN,
     TEMPERATURE_MAX,
 )
+from .setup_trace import traced_platform_setup
 
 _LOGGER = getLogger(__name__)
 SUPPORT_FLAGS = (
@@ -35,12 +36,13 @@ SUPPORT_FLAGS = (
 )
 
 
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
     vehicle_id = config_entry.data[CONF_VEHICLE_ID]
     coordinator: VehicleCoordinator = hass.data[DOMAIN][vehicle_id]
-    if coordinator.can_remote_climate:
+    if coordinator.capabilities.remote_climate:
         _LOGGER.debug("Adding climate entity")
         async_add_entities([Thermostat(coordinator)])
     else:
@@ -51,6 +53,7 @@ class Thermostat(VehicleCoordinatorBaseEntity, ClimateEntity):
     """Create thermostat."""
 
     _attr_supported_features = SUPPORT_FLAGS
+    coordinator_fields = frozenset(("climate_hvac_on",))
     _enable_turn_on_off_backwards_compatibility = False
 
     def __init__(self, coordinator: VehicleCoordinator):
@@ -77,15 +80,23 @@ class Thermostat(VehicleCoordinatorBaseEntity, ClimateEntity):
         else:
             return HVACMode.OFF
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Show starting or stopping until the vehicle reports the new state."""
+        attributes = super().extra_state_attributes
+        transition = self.coordinator.transition("climate")
+        if transition is None:
+            return attributes
+        return {**(attributes or {}), "transition": transition}
+
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Update hvac mode."""
         _LOGGER.debug(f"set_hvac_mode; hvac_mode:{hvac_mode}")
         match hvac_mode.strip().lower():
             case HVACMode.OFF:
-                await self.coordinator.api_connection.stop_climate(vehicle_id=self.coordinator.vehicle_id)
+                await self.coordinator.command_queue.async_run("stop_climate")
             case HVACMode.HEAT_COOL | HVACMode.AUTO:
-                await self.coordinator.api_connection.start_climate(
-                    vehicle_id=self.coordinator.vehicle_id,
+                await self.coordinator.command_coalescer.async_start_climate(
                     climate=True,
                     set_temp=int(self.target_temperature),
                     defrost=self.coordinator.climate_desired_defrost,
@@ -95,11 +106,9 @@ class Thermostat(VehicleCoordinatorBaseEntity, ClimateEntity):
                     left_rear_seat=self.coordinator.desired_left_rear_seat_comfort,
                     right_rear_seat=self.coordinator.desired_right_rear_seat_comfort,
                 )
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         _LOGGER.debug(f"set_temperature; kwargs:{kwargs}")
         self._attr_target_temperature = kwargs.get(ATTR_TEMPERATURE)
-        self.coordinator.async_update_listeners()
+        self.async_write_ha_state()
@@ -0,0 +1,99 @@
+"""Merge charge limit and climate changes made in quick succession into one command."""
+
+from asyncio import Future, shield
+from dataclasses import dataclass, field
+from functools import partial
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+
+if TYPE_CHECKING:
+    from .vehicle_coordinator import VehicleCoordinator
+
+_LOGGER = getLogger(__name__)
+
+# seconds from the first change until the merged command is sent
+COALESCE_WINDOW: Final = 2
+SET_CHARGE_LIMITS: Final = "set_charge_limits"
+START_CLIMATE: Final = "start_climate"
+
+
+@dataclass
+class _PendingCommand:
+    future: Future
+    unsub: CALLBACK_TYPE
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+def _retrieve_exception(future: Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+class CommandCoalescer:
+    """Collect settings per command for a short window and send them as one call."""
+
+    def __init__(self, coordinator: "VehicleCoordinator") -> None:
+        self._coordinator = coordinator
+        self._pending: dict[str, _PendingCommand] = {}
+
+    async def async_set_charge_limits(self, ac_limit: int | None = None, dc_limit: int | None = None) -> None:
+        """Set one or both limits, a limit left out keeps the shown value."""
+        kwargs = {}
+        if ac_limit is not None:
+            kwargs["ac_limit"] = ac_limit
+        if dc_limit is not None:
+            kwargs["dc_limit"] = dc_limit
+        await self._async_merge(SET_CHARGE_LIMITS, kwargs)
+
+    async def async_start_climate(self, **kwargs: Any) -> None:
+        """Start climate, later calls in the window override earlier settings."""
+        await self._async_merge(START_CLIMATE, kwargs)
+
+    async def _async_merge(self, method: str, kwargs: dict[str, Any]) -> None:
+        coordinator = self._coordinator
+        pending = self._pending.get(method)
+        if pending is None:
+            hass = coordinator.hass
+            pending = self._pending[method] = _PendingCommand(
+                future=hass.loop.create_future(),
+                unsub=async_call_later(hass, COALESCE_WINDOW, partial(self._async_send, method)),
+            )
+            # every caller may have given up by the time the command fails
+            pending.future.add_done_callback(_retrieve_exception)
+        else:
+            _LOGGER.debug(f"merging {kwargs} into pending {method}")
+        pending.kwargs.update(kwargs)
+        if method == SET_CHARGE_LIMITS:
+            # the shown limits include the expected ones of earlier commands not reported yet
+            pending.kwargs.setdefault("ac_limit", coordinator.ev_charge_limits_ac)
+            pending.kwargs.setdefault("dc_limit", coordinator.ev_charge_limits_dc)
+        coordinator.async_expect(method, pending.kwargs)
+        # a caller giving up must not cancel the command for the others
+        await shield(pending.future)
+
+    async def _async_send(self, method: str, _now=None) -> None:
+        pending = self._pending.pop(method)
+        coordinator = self._coordinator
+        kwargs = pending.kwargs
+        _LOGGER.debug(f"sending {method} with {kwargs}")
+        try:
+            await coordinator.command_queue.async_run(method, **kwargs)
+        except Exception as err:
+            pending.future.set_exception(err)
+            return
+        except BaseException:
+            # cancelled by the queue on unload, the callers must not wait forever
+            pending.future.cancel()
+            raise
+        pending.future.set_result(None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending commands, e.g. when the entry unloads."""
+        for pending in self._pending.values():
+            pending.unsub()
+            pending.future.cancel()
+        self._pending.clear()
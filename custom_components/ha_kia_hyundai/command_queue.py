@@ -0,0 +1,140 @@
+"""Run the remote commands of a vehicle one at a time, door commands first."""
+
+import heapq
+from asyncio import Future, Task, shield
+from dataclasses import dataclass, field
+from itertools import count
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.core import callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .vehicle_coordinator import VehicleCoordinator
+
+_LOGGER = getLogger(__name__)
+
+# seconds to wait for an action to finish before the next command is sent anyway
+ACTION_TIMEOUT: Final = 300
+# lower runs first
+METHOD_PRIORITY: Final = {
+    "lock": 0,
+    "unlock": 0,
+    "start_climate": 1,
+    "stop_climate": 1,
+    "start_charge": 2,
+    "stop_charge": 2,
+    "set_charge_limits": 2,
+    "request_vehicle_data_sync": 3,
+}
+# a pending command is replaced by a newer one of the same group
+METHOD_GROUP: Final = {
+    "lock": "door",
+    "unlock": "door",
+    "start_climate": "climate",
+    "stop_climate": "climate",
+    "start_charge": "charge",
+    "stop_charge": "charge",
+    "set_charge_limits": "charge_limits",
+    "request_vehicle_data_sync": "sync",
+}
+
+
+@dataclass(order=True)
+class _QueuedCommand:
+    priority: int
+    sequence: int
+    method: str = field(compare=False)
+    kwargs: dict[str, Any] = field(compare=False)
+    future: Future = field(compare=False)
+
+
+class CommandQueue:
+    """Serialize commands so each action is tracked to its end before the next starts."""
+
+    def __init__(self, coordinator: "VehicleCoordinator") -> None:
+        self._coordinator = coordinator
+        self._queue: list[_QueuedCommand] = []
+        self._pending: dict[str, _QueuedCommand] = {}
+        self._sequence = count()
+        self._worker: Task | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @callback
+    def async_submit(self, method: str, **kwargs: Any) -> Future:
+        """Queue the command and return a future for its result.
+
+        A command still waiting in the same group is replaced, both callers
+        get the result of the newer one.
+        """
+        group = METHOD_GROUP[method]
+        self._coordinator.async_expect(method, kwargs)
+        queued = self._pending.get(group)
+        if queued is not None:
+            _LOGGER.debug(f"replacing pending {queued.method} with {method}")
+            queued.method = method
+            queued.kwargs = kwargs
+            return queued.future
+        queued = _QueuedCommand(
+            priority=METHOD_PRIORITY[method],
+            sequence=next(self._sequence),
+            method=method,
+            kwargs=kwargs,
+            future=self._coordinator.hass.loop.create_future(),
+        )
+        heapq.heappush(self._queue, queued)
+        self._pending[group] = queued
+        if self._worker is None or self._worker.done():
+            coordinator = self._coordinator
+            self._worker = coordinator.config_entry.async_create_background_task(
+                coordinator.hass,
+                self._async_work(),
+                name=f"{DOMAIN}-{coordinator.vehicle_id}-command-queue",
+            )
+        return queued.future
+
+    async def async_run(self, method: str, **kwargs: Any) -> Any:
+        """Queue the command and wait until it was sent."""
+        # a caller giving up must not drop a command other callers share
+        return await shield(self.async_submit(method, **kwargs))
+
+    async def _async_work(self) -> None:
+        coordinator = self._coordinator
+        while self._queue:
+            # commands queued meanwhile can still be replaced or jump ahead
+            if coordinator.action_tracker.tracking and not await coordinator.action_tracker.async_wait(ACTION_TIMEOUT):
+                _LOGGER.warning(f"last action still in progress after {ACTION_TIMEOUT}s, sending next command")
+            queued = heapq.heappop(self._queue)
+            del self._pending[METHOD_GROUP[queued.method]]
+            if queued.future.done():
+                continue
+            _LOGGER.debug(f"sending {queued.method}, {len(self._queue)} commands waiting")
+            coordinator.async_command_sent(queued.method)
+            try:
+                result = await getattr(coordinator.api_connection, queued.method)(**queued.kwargs)
+            except Exception as err:
+                if METHOD_GROUP[queued.method] not in self._pending:
+                    coordinator.async_command_failed(queued.method)
+                queued.future.set_exception(err)
+                continue
+            except BaseException:
+                # cancelled on unload, the callers must not wait forever
+                queued.future.cancel()
+                raise
+            queued.future.set_result(result)
+            coordinator.async_track_action()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the waiting commands and stop the worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+        for queued in self._queue:
+            queued.future.cancel()
+        self._queue.clear()
+        self._pending.clear()
@@ -13,9 +13,10 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
 )
 from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from kia_hyundai_api import UsKia
 
+from .account import async_hand_off_login
+from .session_manager import AccountSession
 from .const import (
     CONF_DEVICE_ID,
     CONF_OTP_CODE,
@@ -26,9 +27,27 @@ from .const import (
     CONF_VEHICLE_ID,
     DEFAULT_SCAN_INTERVAL,
     CONFIG_FLOW_TEMP_VEHICLES,
+    CONF_ACTIVE_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_IDLE_AFTER,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_IDLE_AFTER,
+    CONF_RATE_LIMIT_BURST,
+    CONF_RATE_LIMIT_PER_MINUTE,
+    CONF_LOCATION_THRESHOLD,
+    CONF_DAILY_WAKE_UPS,
+    CONF_MAX_STALENESS,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_RATE_LIMIT_PER_MINUTE,
+    DEFAULT_LOCATION_THRESHOLD,
+    DEFAULT_DAILY_WAKE_UPS,
+    DEFAULT_MAX_STALENESS,
 )
 
 _LOGGER = logging.getLogger(__name__)
+# seconds the login waits for the code entered in the otp step
+OTP_TIMEOUT = 120
 
 class OneTimePasswordStarted(Exception):
     pass
@@ -44,6 +63,54 @@ class KiaUvoOptionFlowHandler(OptionsFlow):
                         CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                     ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=999)),
+                vol.Optional(
+                    CONF_ACTIVE_SCAN_INTERVAL,
+                    default=config_entry.options.get(
+                        CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=999)),
+                vol.Optional(
+                    CONF_IDLE_SCAN_INTERVAL,
+                    default=config_entry.options.get(
+                        CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=999)),
+                vol.Optional(
+                    CONF_IDLE_AFTER,
+                    default=config_entry.options.get(
+                        CONF_IDLE_AFTER, DEFAULT_IDLE_AFTER
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=168)),
+                vol.Optional(
+                    CONF_RATE_LIMIT_BURST,
+                    default=config_entry.options.get(
+                        CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                vol.Optional(
+                    CONF_RATE_LIMIT_PER_MINUTE,
+                    default=config_entry.options.get(
+                        CONF_RATE_LIMIT_PER_MINUTE, DEFAULT_RATE_LIMIT_PER_MINUTE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+                vol.Optional(
+                    CONF_LOCATION_THRESHOLD,
+                    default=config_entry.options.get(
+                        CONF_LOCATION_THRESHOLD, DEFAULT_LOCATION_THRESHOLD
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                vol.Optional(
+                    CONF_DAILY_WAKE_UPS,
+                    default=config_entry.options.get(
+                        CONF_DAILY_WAKE_UPS, DEFAULT_DAILY_WAKE_UPS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=48)),
+                vol.Optional(
+                    CONF_MAX_STALENESS,
+                    default=config_entry.options.get(
+                        CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
             }
         )
 
@@ -67,6 +134,13 @@ class KiaUvoConfigFlowHandler(config_entries.ConfigFlow):
     last_action: dict[str, Any] | None = None
     notify_type: str | None = None
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.data = {}
+        # resolved by the otp step, None once the login consumed it
+        self.otp_code: asyncio.Future[str] | None = None
+        # owned by the flow until the login is handed off to the entry setup
+        self.session: AccountSession | None = None
 
     @staticmethod
     @callback
@@ -90,30 +164,33 @@ class KiaUvoConfigFlowHandler(config_entries.ConfigFlow):
             username = user_input[CONF_USERNAME]
             password = user_input[CONF_PASSWORD]
             otp_type = user_input[CONF_OTP_TYPE]
+            self.otp_code = self.hass.loop.create_future()
+
             async def otp_callback(context: dict[str, Any]):
                 if context["stage"] == "choose_destination":
                     _LOGGER.debug(f"OTP context: {context}")
                     return { "notify_type": otp_type }
                 if context["stage"] == "input_code":
-                    loop_counter = 0
-                    while loop_counter < 120:
-                        _LOGGER.debug(f"data: {self.data}")
-                        if CONF_OTP_CODE in self.data:
-                            _LOGGER.debug(f"OTP code: {self.data[CONF_OTP_CODE]}")
-                            return { "otp_code": self.data[CONF_OTP_CODE] }
-                        loop_counter += 1
-                        _LOGGER.debug(f"Waiting for OTP {loop_counter}")
-                        _LOGGER.debug(f"data: {self.data}")
-                        await asyncio.sleep(1)
-                    raise ConfigEntryAuthFailed("2 minute timeout waiting for OTP")
+                    if self.otp_code is None:
+                        # a later login of the handed off connection
+                        raise ConfigEntryAuthFailed("otp required")
+                    _LOGGER.debug("Waiting for OTP")
+                    try:
+                        otp_code = await asyncio.wait_for(asyncio.shield(self.otp_code), OTP_TIMEOUT)
+                    except TimeoutError as err:
+                        raise ConfigEntryAuthFailed("2 minute timeout waiting for OTP") from err
+                    finally:
+                        self.otp_code = None
+                    return { "otp_code": otp_code }
 
             try:
-                client_session = async_get_clientsession(self.hass)
+                if self.session is None:
+                    self.session = AccountSession(self.hass)
                 self.api_connection = UsKia(
                     username=username,
                     password=password,
                     otp_callback=otp_callback,
-                    client_session=client_session,
+                    client_session=self.session.client_session,
                 )
                 self.data.update(user_input)
 #                try:
@@ -138,6 +215,8 @@ class KiaUvoConfigFlowHandler(config_entries.ConfigFlow):
         errors: dict[str, str] = {}
         if user_input is not None:
             self.data.update(user_input)
+            if self.otp_code is not None and not self.otp_code.done():
+                self.otp_code.set_result(user_input[CONF_OTP_CODE])
             try:
                 await self.otp_task
             except DataError:
@@ -180,11 +259,13 @@ class KiaUvoConfigFlowHandler(config_entries.ConfigFlow):
             self.data[CONF_DEVICE_ID] = self.api_connection.device_id
             if self.source == SOURCE_REAUTH:
                 self._abort_if_unique_id_mismatch()
+                self._hand_off_login()
                 return self.async_update_reload_and_abort(
                     self._get_reauth_entry(),
                     data_updates=self.data,
                 )
             self._abort_if_unique_id_configured()
+            self._hand_off_login()
             return self.async_create_entry(
                 title=vehicle_map[user_input[CONF_VEHICLE_ID]],
                 data=self.data,
@@ -195,3 +276,17 @@ class KiaUvoConfigFlowHandler(config_entries.ConfigFlow):
                 data_schema=vol.Schema(data_schema),
                 errors=errors,
             )
+
+    def _hand_off_login(self) -> None:
+        """Let the entry setup continue with this login and vehicle list."""
+        async_hand_off_login(
+            self.hass, self.data[CONF_USERNAME], self.data[CONF_PASSWORD], self.api_connection, self.session
+        )
+        self.session = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the session of a flow that ended without handing off its login."""
+        if self.session is not None:
+            self.hass.async_create_task(self.session.async_close())
+            self.session = None
@@ -12,7 +12,27 @@ CONF_REFRESH_TOKEN: str = "refresh_token"
 
 CONFIG_FLOW_TEMP_VEHICLES: str = "vehicles"
 
+DATA_ACCOUNTS: str = f"{DOMAIN}_accounts"
+DATA_PENDING_LOGINS: str = f"{DOMAIN}_pending_logins"
+
+CONF_ACTIVE_SCAN_INTERVAL: str = "active_scan_interval"
+CONF_IDLE_SCAN_INTERVAL: str = "idle_scan_interval"
+CONF_IDLE_AFTER: str = "idle_after"
+CONF_RATE_LIMIT_BURST: str = "rate_limit_burst"
+CONF_RATE_LIMIT_PER_MINUTE: str = "rate_limit_per_minute"
+CONF_LOCATION_THRESHOLD: str = "location_threshold"
+CONF_DAILY_WAKE_UPS: str = "daily_wake_ups"
+CONF_MAX_STALENESS: str = "max_staleness"
+
 DEFAULT_SCAN_INTERVAL: int = 10
+DEFAULT_ACTIVE_SCAN_INTERVAL: int = 2
+DEFAULT_IDLE_SCAN_INTERVAL: int = 60
+DEFAULT_IDLE_AFTER: int = 6
+DEFAULT_RATE_LIMIT_BURST: int = 10
+DEFAULT_RATE_LIMIT_PER_MINUTE: int = 20
+DEFAULT_LOCATION_THRESHOLD: int = 50
+DEFAULT_DAILY_WAKE_UPS: int = 6
+DEFAULT_MAX_STALENESS: int = 60
 DELAY_BETWEEN_ACTION_IN_PROGRESS_CHECKING: int = 20
 TEMPERATURE_MIN = 62
 TEMPERATURE_MAX = 82
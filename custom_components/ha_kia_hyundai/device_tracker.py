@@ -2,18 +2,24 @@ from logging import getLogger
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntityDescription
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
+from homeassistant.components.zone import DOMAIN as ZONE_DOMAIN
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+from homeassistant.util.location import distance
 
-from .const import DOMAIN, CONF_VEHICLE_ID
+from .const import DOMAIN, CONF_LOCATION_THRESHOLD, CONF_VEHICLE_ID, DEFAULT_LOCATION_THRESHOLD
 from .vehicle_coordinator import VehicleCoordinator
 from .vehicle_coordinator_base_entity import VehicleCoordinatorBaseEntity
+from .zone_index import ZoneIndex
+from .setup_trace import traced_platform_setup
 
 _LOGGER = getLogger(__name__)
 PARALLEL_UPDATES: int = 1
 
 
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
@@ -24,12 +30,63 @@ async def async_setup_entry(
 
 
 class LocationTracker(VehicleCoordinatorBaseEntity, TrackerEntity):
+    """Publish the location only once the vehicle moved further than the threshold."""
+
+    coordinator_fields = frozenset(("latitude", "longitude", "location_synced"))
+
     def __init__(self, coordinator: VehicleCoordinator):
         super().__init__(coordinator, TrackerEntityDescription(
             key="location",
             name="Location",
             icon="mdi:map-marker-outline",
         ))
+        self._threshold: int = coordinator.entry_options.get(CONF_LOCATION_THRESHOLD, DEFAULT_LOCATION_THRESHOLD)
+        self._zones: ZoneIndex = ZoneIndex(())
+        self._latitude: float | None = None
+        self._longitude: float | None = None
+        self._location_synced = None
+        self._location_name: str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._zones = ZoneIndex.from_states(self.hass.states.async_all(ZONE_DOMAIN))
+        self.async_on_remove(async_track_state_change_filtered(
+            self.hass, TrackStates(False, set(), {ZONE_DOMAIN}), self._async_zones_changed,
+        ).async_remove)
+        self._update_location()
+
+    @callback
+    def _async_zones_changed(self, _event: Event[EventStateChangedData]) -> None:
+        self._zones = ZoneIndex.from_states(self.hass.states.async_all(ZONE_DOMAIN))
+        if self._latitude is None:
+            return
+        location_name = self._zones.location_name(self._latitude, self._longitude)
+        if location_name != self._location_name:
+            self._location_name = location_name
+            self.async_write_ha_state()
+
+    def _has_changed(self) -> bool:
+        return super()._has_changed() and self._update_location()
+
+    def _update_location(self) -> bool:
+        """Take over the reported location if it is newer and far enough away, return true if it was."""
+        coordinator = self.coordinator
+        latitude, longitude, synced = coordinator.latitude, coordinator.longitude, coordinator.location_synced
+        if latitude is None or longitude is None:
+            changed = self._latitude is not None
+            self._latitude = self._longitude = self._location_synced = self._location_name = None
+            return changed
+        if self._latitude is not None:
+            if synced is not None and self._location_synced is not None and synced <= self._location_synced:
+                # an older fix than the published one
+                return False
+            # measured from the published location so slow drift still adds up
+            moved = distance(self._latitude, self._longitude, latitude, longitude)
+            if moved is not None and moved < self._threshold:
+                return False
+        self._latitude, self._longitude, self._location_synced = latitude, longitude, synced
+        self._location_name = self._zones.location_name(latitude, longitude)
+        return True
 
     @property
     def source_type(self):
@@ -37,11 +94,15 @@ class LocationTracker(VehicleCoordinatorBaseEntity, TrackerEntity):
 
     @property
     def latitude(self) -> float | None:
-        return self.coordinator.latitude
+        return self._latitude
 
     @property
     def longitude(self) -> float | None:
-        return self.coordinator.longitude
+        return self._longitude
+
+    @property
+    def location_name(self) -> str | None:
+        return self._location_name
 
     @property
     def available(self) -> bool:
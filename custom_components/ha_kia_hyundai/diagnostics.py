@@ -10,16 +10,18 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from . import VehicleCoordinator
 from .const import DOMAIN, CONF_VEHICLE_ID
 
-TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_UNIQUE_ID, "vehicle_identifier"}
-TO_REDACT_MAPPED = {
+from .refresh_history import RefreshRecord
+
+TO_REDACT = frozenset({CONF_USERNAME, CONF_PASSWORD, CONF_UNIQUE_ID, "vehicle_identifier"})
+TO_REDACT_MAPPED = frozenset({
     "identifier",
     "vin",
     "key",
     "latitude",
     "longitude",
     "location_name",
-}
-TO_REDACT_RAW = {
+})
+TO_REDACT_RAW = frozenset({
     "vehicle_identifier",
     "vinKey",
     "vin",
@@ -30,9 +32,9 @@ TO_REDACT_RAW = {
     "lat",
     "lon",
     "invDealerCode",
-}
-TO_REDACT_DEVICE = {"identifiers"}
-TO_REDACT_ENTITIES = {"latitude", "longitude"}
+})
+TO_REDACT_DEVICE = frozenset({"identifiers"})
+TO_REDACT_ENTITIES = frozenset({"latitude", "longitude"})
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,16 +44,66 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, dict[str, any]]:
     """Return diagnostics for a config entry."""
     coordinator: VehicleCoordinator = hass.data[DOMAIN][config_entry.data[CONF_VEHICLE_ID]]
-    data = {
-        "entry": async_redact_data(config_entry.as_dict(), TO_REDACT),
-        "vehicle_raw_response": async_redact_data(coordinator.data, TO_REDACT_RAW),
-    }
 
+    # registries and states are read on the loop, the copying and redacting happens in the executor
     device_registry = dr.async_get(hass)
     entity_registry = er.async_get(hass)
     hass_device = device_registry.async_get_device(
         identifiers={(DOMAIN, str(coordinator.vehicle_id))}
     )
+    entities = []
+    if hass_device:
+        hass_entities = er.async_entries_for_device(
+            entity_registry,
+            device_id=hass_device.id,
+            include_disabled_entities=True,
+        )
+        for entity_entry in hass_entities:
+            state = hass.states.get(entity_entry.entity_id)
+            entities.append((entity_entry, state.as_dict() if state else None))
+
+    return await hass.async_add_executor_job(
+        _build_diagnostics,
+        config_entry.as_dict(),
+        coordinator.data,
+        coordinator.refresh_history.records(),
+        coordinator.api_connection.metrics.as_dict(),
+        coordinator.api_connection.account.circuit_breaker.as_dict(),
+        coordinator.telemetry.as_dict(),
+        coordinator.setup_trace.as_dict(),
+        hass_device,
+        entities,
+    )
+
+
+def _build_diagnostics(
+    entry: dict[str, any],
+    vehicle_raw_response: dict[str, any],
+    refresh_history: tuple[RefreshRecord, ...],
+    api_metrics: dict[str, any],
+    circuit_breaker: dict[str, any],
+    telemetry: dict[str, any],
+    setup_trace: dict[str, any],
+    hass_device: dr.DeviceEntry | None,
+    entities: list[tuple[er.RegistryEntry, dict[str, any] | None]],
+) -> dict[str, dict[str, any]]:
+    data = {
+        "entry": async_redact_data(entry, TO_REDACT),
+        "vehicle_raw_response": async_redact_data(vehicle_raw_response, TO_REDACT_RAW),
+        "refresh_history": [
+            {
+                "time": record.time.isoformat(),
+                "duration_ms": round(record.duration_ms),
+                "error": record.error,
+                "response": async_redact_data(record.payload, TO_REDACT_RAW) if record.payload is not None else None,
+            }
+            for record in refresh_history
+        ],
+        "api_metrics": api_metrics,
+        "circuit_breaker": circuit_breaker,
+        "telemetry": telemetry,
+        "setup_trace": setup_trace,
+    }
     if not hass_device:
         return data
 
@@ -60,17 +112,10 @@ async def async_get_config_entry_diagnostics(
         "entities": {},
     }
 
-    hass_entities = er.async_entries_for_device(
-        entity_registry,
-        device_id=hass_device.id,
-        include_disabled_entities=True,
-    )
-
-    for entity_entry in hass_entities:
-        state = hass.states.get(entity_entry.entity_id)
+    for entity_entry, state in entities:
         state_dict = None
         if state:
-            state_dict = dict(state.as_dict())
+            state_dict = dict(state)
             # The entity_id is already provided at root level.
             state_dict.pop("entity_id", None)
             # The context doesn't provide useful information in this case.
@@ -11,17 +11,19 @@ from .const import (
 )
 from .vehicle_coordinator import VehicleCoordinator
 from .vehicle_coordinator_base_entity import VehicleCoordinatorBaseEntity
+from .setup_trace import traced_platform_setup
 
 _LOGGER = getLogger(__name__)
 PARALLEL_UPDATES: int = 1
 
 
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
     vehicle_id = config_entry.data[CONF_VEHICLE_ID]
     coordinator: VehicleCoordinator = hass.data[DOMAIN][vehicle_id]
-    if coordinator.can_remote_lock:
+    if coordinator.capabilities.remote_lock:
         async_add_entities([Lock(coordinator)])
 
 
@@ -39,16 +41,20 @@ class Lock(VehicleCoordinatorBaseEntity, LockEntity):
     def is_locked(self) -> bool:
         return self.coordinator.doors_locked
 
+    @property
+    def is_locking(self) -> bool:
+        return self.coordinator.transition("door") == "locking"
+
+    @property
+    def is_unlocking(self) -> bool:
+        return self.coordinator.transition("door") == "unlocking"
+
     @property
     def icon(self):
         return "mdi:lock" if self.is_locked else "mdi:lock-open-variant"
 
     async def async_lock(self, **kwargs: any):
-        await self.coordinator.api_connection.lock(vehicle_id=self.coordinator.vehicle_id)
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.command_queue.async_run("lock")
 
     async def async_unlock(self, **kwargs: any):
-        await self.coordinator.api_connection.unlock(vehicle_id=self.coordinator.vehicle_id)
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.command_queue.async_run("unlock")
@@ -14,6 +14,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from custom_components.ha_kia_hyundai import DOMAIN, CONF_VEHICLE_ID, VehicleCoordinator
 from custom_components.ha_kia_hyundai.vehicle_coordinator_base_entity import VehicleCoordinatorBaseEntity
+from custom_components.ha_kia_hyundai.setup_trace import traced_platform_setup
 
 _LOGGER = getLogger(__name__)
 
@@ -44,6 +45,7 @@ NUMBER_DESCRIPTIONS: Final[tuple[NumberEntityDescription, ...]] = (
 )
 
 
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -54,7 +56,7 @@ async def async_setup_entry(
 
     entities = []
     for description in NUMBER_DESCRIPTIONS:
-        if getattr(coordinator, description.key, None) is not None:
+        if coordinator.capabilities.has(description.key):
             entities.append(
                 ChargeLimitNumber(coordinator, description)
             )
@@ -95,20 +97,11 @@ class ChargeLimitNumber(VehicleCoordinatorBaseEntity, NumberEntity, RestoreEntit
         ):
             return
 
-        # set new limits
+        # the other limit is filled in when the merged command is sent
         if self.entity_description.key == AC_CHARGING_LIMIT_KEY:
-            ac_limit = int(value)
-            dc_limit = self.coordinator.ev_charge_limits_dc
+            await self.coordinator.command_coalescer.async_set_charge_limits(ac_limit=int(value))
         else:
-            ac_limit = self.coordinator.ev_charge_limits_ac
-            dc_limit = int(value)
-        await self.coordinator.api_connection.set_charge_limits(
-            vehicle_id=self.coordinator.vehicle_id,
-            ac_limit=ac_limit,
-            dc_limit=dc_limit,
-        )
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
+            await self.coordinator.command_coalescer.async_set_charge_limits(dc_limit=int(value))
 
 
     async def async_internal_added_to_hass(self) -> None:
@@ -0,0 +1,125 @@
+"""Expected field values of commands shown on top of the reported snapshot."""
+
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Final
+
+from .vehicle_snapshot import VehicleSnapshot
+
+# seconds an expectation is shown without a refresh confirming it
+EXPECTATION_TIMEOUT: Final = 600
+TRANSITIONS: Final = {
+    "lock": "locking",
+    "unlock": "unlocking",
+    "start_climate": "starting",
+    "stop_climate": "stopping",
+    "start_charge": "starting",
+    "stop_charge": "stopping",
+}
+
+
+def expected_values(method: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Return the field values the vehicle should report once the command succeeded."""
+    match method:
+        case "lock":
+            return {"doors_locked": True}
+        case "unlock":
+            return {"doors_locked": False}
+        case "start_climate":
+            values = {"climate_hvac_on": bool(kwargs.get("climate", True))}
+            if kwargs.get("set_temp") is not None:
+                values["climate_temperature_value"] = int(kwargs["set_temp"])
+            if "defrost" in kwargs:
+                values["climate_defrost_on"] = bool(kwargs["defrost"])
+            return values
+        case "stop_climate":
+            return {"climate_hvac_on": False, "climate_defrost_on": False}
+        case "start_charge":
+            return {"ev_battery_charging": True}
+        case "stop_charge":
+            return {"ev_battery_charging": False}
+        case "set_charge_limits":
+            values = {}
+            if kwargs.get("ac_limit") is not None:
+                values["ev_charge_limits_ac"] = kwargs["ac_limit"]
+            if kwargs.get("dc_limit") is not None:
+                values["ev_charge_limits_dc"] = kwargs["dc_limit"]
+            return values
+    return {}
+
+
+@dataclass
+class Expectation:
+    method: str
+    values: dict[str, Any]
+    expires: float
+    sent: bool = False
+    # the action finished, the next refresh decides
+    settled: bool = False
+
+    @property
+    def transition(self) -> str | None:
+        return TRANSITIONS.get(self.method)
+
+
+class OptimisticOverlay:
+    """One expectation per command group, replaced by newer commands of the group."""
+
+    def __init__(self) -> None:
+        self._expectations: dict[str, Expectation] = {}
+
+    def expect(self, group: str, method: str, kwargs: dict[str, Any]) -> set[str]:
+        """Show the outcome of the command, return the fields to update."""
+        previous = self._expectations.get(group)
+        expectation = Expectation(
+            method=method,
+            values=expected_values(method, kwargs),
+            expires=monotonic() + EXPECTATION_TIMEOUT,
+        )
+        self._expectations[group] = expectation
+        fields = set(expectation.values)
+        if previous is not None:
+            fields.update(previous.values)
+        return fields
+
+    def mark_sent(self, group: str, method: str) -> None:
+        expectation = self._expectations.get(group)
+        if expectation is not None and expectation.method == method:
+            expectation.sent = True
+
+    def discard(self, group: str, method: str) -> set[str]:
+        """Revert the expectation of a failed command."""
+        expectation = self._expectations.get(group)
+        if expectation is None or expectation.method != method:
+            return set()
+        del self._expectations[group]
+        return set(expectation.values)
+
+    def settle(self) -> None:
+        """Let the next refresh confirm or revert every sent command."""
+        for expectation in self._expectations.values():
+            if expectation.sent:
+                expectation.settled = True
+
+    def reconcile(self, reported: VehicleSnapshot) -> set[str]:
+        """Drop confirmed, settled and expired expectations, return their fields."""
+        now = monotonic()
+        fields = set()
+        for group, expectation in list(self._expectations.items()):
+            confirmed = all(getattr(reported, name) == value for name, value in expectation.values.items())
+            if confirmed or expectation.settled or expectation.expires < now:
+                del self._expectations[group]
+                fields.update(expectation.values)
+        return fields
+
+    def apply(self, reported: VehicleSnapshot) -> VehicleSnapshot:
+        if not self._expectations:
+            return reported
+        values = {}
+        for expectation in self._expectations.values():
+            values.update(expectation.values)
+        return reported.replace(values)
+
+    def transition(self, group: str) -> str | None:
+        expectation = self._expectations.get(group)
+        return expectation.transition if expectation is not None else None
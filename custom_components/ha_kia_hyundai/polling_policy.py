@@ -0,0 +1,64 @@
+"""Pick the next poll interval from the latest vehicle snapshot."""
+
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from logging import getLogger
+from typing import Any, Final
+
+from homeassistant.const import CONF_SCAN_INTERVAL
+
+from .const import (
+    CONF_ACTIVE_SCAN_INTERVAL,
+    CONF_IDLE_AFTER,
+    CONF_IDLE_SCAN_INTERVAL,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_IDLE_AFTER,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+)
+from .vehicle_snapshot import VehicleSnapshot
+
+_LOGGER = getLogger(__name__)
+
+# any of these being true means the vehicle state is moving quickly
+ACTIVE_FIELDS: Final = ("ev_battery_charging", "engine_on", "climate_hvac_on")
+# timestamps change on every sync even when nothing about the vehicle did
+IGNORED_CHANGES: Final = frozenset({"last_synced_to_cloud", "last_synced_from_cloud"})
+
+
+class PollingPolicy:
+    """Short interval while active, long interval once nothing changed for a while."""
+
+    def __init__(
+            self,
+            default_interval: timedelta,
+            active_interval: timedelta,
+            idle_interval: timedelta,
+            idle_after: timedelta,
+    ) -> None:
+        self.default_interval: timedelta = default_interval
+        self.active_interval: timedelta = active_interval
+        self.idle_interval: timedelta = idle_interval
+        self.idle_after: timedelta = idle_after
+        self._previous: VehicleSnapshot | None = None
+        self._last_change: datetime | None = None
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> "PollingPolicy":
+        return cls(
+            default_interval=timedelta(minutes=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+            active_interval=timedelta(minutes=options.get(CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL)),
+            idle_interval=timedelta(minutes=options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL)),
+            idle_after=timedelta(hours=options.get(CONF_IDLE_AFTER, DEFAULT_IDLE_AFTER)),
+        )
+
+    def next_interval(self, snapshot: VehicleSnapshot, now: datetime) -> timedelta:
+        if self._previous is None or snapshot.changed_fields(self._previous) - IGNORED_CHANGES:
+            self._last_change = now
+        self._previous = snapshot
+
+        if any(getattr(snapshot, field) for field in ACTIVE_FIELDS):
+            return self.active_interval
+        if now - self._last_change >= self.idle_after:
+            return self.idle_interval
+        return self.default_interval
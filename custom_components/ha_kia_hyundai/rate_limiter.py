@@ -0,0 +1,79 @@
+"""Account wide token bucket every api call waits on, commands ahead of polls."""
+
+import heapq
+from asyncio import Future, TimerHandle, get_running_loop
+from enum import IntEnum
+from itertools import count
+from logging import getLogger
+from time import monotonic
+
+_LOGGER = getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Lower values are served first when calls wait for a token."""
+
+    COMMAND = 0
+    ACTION_CHECK = 1
+    POLL = 2
+
+
+class RateLimiter:
+    """Allow bursts of calls while keeping the sustained rate under a limit."""
+
+    def __init__(self, burst: int, per_minute: float) -> None:
+        self._burst: int = burst
+        self._per_second: float = per_minute / 60
+        self._tokens: float = burst
+        self._updated: float = monotonic()
+        self._waiters: list[tuple[int, int, Future]] = []
+        self._sequence = count()
+        self._wakeup: TimerHandle | None = None
+
+    def configure(self, burst: int, per_minute: float) -> None:
+        self._refill()
+        self._burst = burst
+        self._per_second = per_minute / 60
+        self._tokens = min(self._tokens, burst)
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._release_waiters()
+
+    @property
+    def waiting(self) -> int:
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._per_second)
+        self._updated = now
+
+    async def acquire(self, priority: Priority) -> None:
+        """Wait for a token, waiting calls of a higher priority go first."""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+        future: Future = get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        _LOGGER.debug(f"rate limited {priority.name.lower()} call, {len(self._waiters)} waiting")
+        self._schedule_wakeup()
+        await future
+
+    def _release_waiters(self) -> None:
+        self._wakeup = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                # cancelled while waiting
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        self._schedule_wakeup()
+
+    def _schedule_wakeup(self) -> None:
+        if self._wakeup is not None or not self._waiters:
+            return
+        delay = max(0.0, (1 - self._tokens) / self._per_second)
+        self._wakeup = get_running_loop().call_later(delay, self._release_waiters)
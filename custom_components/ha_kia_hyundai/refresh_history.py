@@ -0,0 +1,40 @@
+"""The last few refreshes of a vehicle, kept for diagnostics."""
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Final
+
+from homeassistant.util import dt as dt_util
+
+HISTORY_SIZE: Final = 10
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshRecord:
+    time: datetime
+    duration_ms: float
+    # the payload is never mutated once the refresh returned it, redaction happens at dump time
+    payload: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class RefreshHistory:
+    """Bounded history of refresh payloads and failures."""
+
+    def __init__(self, size: int = HISTORY_SIZE) -> None:
+        self._records: deque[RefreshRecord] = deque(maxlen=size)
+
+    def record(self, payload: dict[str, Any], duration_ms: float) -> None:
+        self._records.append(RefreshRecord(time=dt_util.utcnow(), duration_ms=duration_ms, payload=payload))
+
+    def record_error(self, error: Exception, duration_ms: float) -> None:
+        self._records.append(RefreshRecord(
+            time=dt_util.utcnow(),
+            duration_ms=duration_ms,
+            error=f"{type(error).__name__} {error}",
+        ))
+
+    def records(self) -> tuple[RefreshRecord, ...]:
+        """Return the records oldest first, safe to hand to an executor."""
+        return tuple(self._records)
@@ -14,6 +14,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from . import VehicleCoordinator
 from .const import CONF_VEHICLE_ID, DOMAIN, SEAT_STATUS, STR_TO_ENUM
 from .vehicle_coordinator_base_entity import VehicleCoordinatorBaseEntity
+from .setup_trace import traced_platform_setup
 
 OFF = ["Off"]
 HEAT_OPTIONS = {
@@ -71,6 +72,7 @@ SEAT_SELECTIONS: Final[tuple[KiaSelectEntityDescription, ...]] = (
 )
 
 
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -83,7 +85,7 @@ async def async_setup_entry(
     async_add_entities(
         SeatSelect(coordinator, select_description)
         for select_description in SEAT_SELECTIONS
-        if coordinator.has_climate_seats
+        if coordinator.capabilities.climate_seats
         if select_description.exists_fn(coordinator)
     )
 
@@ -92,6 +94,7 @@ class SeatSelect(VehicleCoordinatorBaseEntity, SelectEntity, RestoreEntity):
     """Class for seat select entities."""
 
     entity_description: KiaSelectEntityDescription
+    coordinator_fields = frozenset(("front_seat_options", "rear_seat_options"))
 
     @property
     def options(self) -> list[str]:
@@ -1,7 +1,7 @@
 from collections.abc import Callable
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Final
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,8 +11,11 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    MATCH_ALL,
     PERCENTAGE,
     STATE_UNAVAILABLE,
+    EntityCategory,
+    UnitOfInformation,
     UnitOfLength,
     UnitOfTemperature,
     UnitOfTime,
@@ -22,8 +25,10 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import VehicleCoordinator
+from .api_metrics import ACTION_CHECK_METHOD, METRICS_FIELD, STATUS_METHOD, ApiMetrics
 from .const import CONF_VEHICLE_ID, DOMAIN, SEAT_STATUS
 from .vehicle_coordinator_base_entity import VehicleCoordinatorBaseEntity
+from .setup_trace import traced_platform_setup
 
 _LOGGER = getLogger(__name__)
 PARALLEL_UPDATES: int = 1
@@ -159,6 +164,111 @@ SEAT_SENSOR_DESCRIPTIONS: Final[tuple[KiaSensorEntityDescription, ...]] = (
 )
 
 
+
+@dataclass(frozen=True, kw_only=True)
+class KiaChargingSensorEntityDescription(SensorEntityDescription):
+    """A class that describes sensors derived from the reported charging progress."""
+
+    coordinator_fields: frozenset[str]
+
+
+CHARGING_SENSOR_DESCRIPTIONS: Final[tuple[KiaChargingSensorEntityDescription, ...]] = (
+    KiaChargingSensorEntityDescription(
+        key="ev_charge_rate",
+        name="Charge Rate",
+        icon="mdi:battery-charging-high",
+        native_unit_of_measurement=f"{PERCENTAGE}/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        coordinator_fields=frozenset(("ev_charge_rate", "ev_battery_charging")),
+    ),
+    KiaChargingSensorEntityDescription(
+        key="ev_charge_time_to_target",
+        name="Estimated Time to Charge Limit",
+        icon="mdi:battery-clock",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        coordinator_fields=frozenset((
+            "ev_charge_rate",
+            "ev_battery_charging",
+            "ev_battery_level",
+            "ev_plug_type",
+            "ev_charge_limits_ac",
+            "ev_charge_limits_dc",
+        )),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class KiaApiMetricSensorEntityDescription(SensorEntityDescription):
+    """A class that describes api metric sensor entities."""
+
+    value_fn: Callable[[ApiMetrics], float | int | None]
+    attributes_fn: Callable[[ApiMetrics], dict[str, Any]]
+    entity_category: EntityCategory = EntityCategory.DIAGNOSTIC
+    # written on every refresh, only worth it while troubleshooting
+    entity_registry_enabled_default: bool = False
+
+
+def _latency_description(key: str, name: str, histogram_fn) -> KiaApiMetricSensorEntityDescription:
+    return KiaApiMetricSensorEntityDescription(
+        key=key,
+        name=name,
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda metrics: histogram_fn(metrics).percentile(0.95),
+        attributes_fn=lambda metrics: histogram_fn(metrics).as_dict(),
+    )
+
+
+API_METRIC_SENSOR_DESCRIPTIONS: Final[tuple[KiaApiMetricSensorEntityDescription, ...]] = (
+    _latency_description(
+        "api_status_latency",
+        "API Status Latency",
+        lambda metrics: metrics.method_latency(STATUS_METHOD),
+    ),
+    _latency_description(
+        "api_action_check_latency",
+        "API Action Check Latency",
+        lambda metrics: metrics.method_latency(ACTION_CHECK_METHOD),
+    ),
+    _latency_description(
+        "api_command_latency",
+        "API Command Latency",
+        lambda metrics: metrics.commands_latency(),
+    ),
+    _latency_description(
+        "refresh_duration",
+        "Refresh Duration",
+        lambda metrics: metrics.refresh,
+    ),
+    KiaApiMetricSensorEntityDescription(
+        key="api_errors",
+        name="API Errors",
+        icon="mdi:api-off",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.error_count,
+        attributes_fn=lambda metrics: {"errors": dict(metrics.errors), "last_error": metrics.last_error},
+    ),
+    KiaApiMetricSensorEntityDescription(
+        key="api_payload_size",
+        name="API Payload Size",
+        icon="mdi:code-json",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.payload_bytes,
+        attributes_fn=lambda metrics: {},
+    ),
+)
+
+
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -169,8 +279,8 @@ async def async_setup_entry(
         APIActionInProgress(coordinator=coordinator),
     ]
     for sensor_description in SENSOR_DESCRIPTIONS:
-        _LOGGER.debug(f"Adding sensor {sensor_description.key}? preserve_state:{sensor_description.preserve_state is True} or value:{getattr(coordinator, sensor_description.key)} is not None:{getattr(coordinator, sensor_description.key) is not None}")
-        if sensor_description.preserve_state or getattr(coordinator, sensor_description.key) is not None:
+        # preserved sensors restore their last state while the vehicle omits the value
+        if sensor_description.preserve_state or coordinator.capabilities.has(sensor_description.key):
             _LOGGER.debug(f"added {sensor_description.key}")
             sensors.append(
                 InstrumentSensor(
@@ -181,9 +291,18 @@ async def async_setup_entry(
     sensors.extend(
         SeatSensor(coordinator, seat_description)
         for seat_description in SEAT_SENSOR_DESCRIPTIONS
-        if coordinator.has_climate_seats
+        if coordinator.capabilities.climate_seats
         if seat_description.exists_fn(coordinator)
     )
+    if coordinator.capabilities.has("ev_battery_charging"):
+        sensors.extend(
+            ChargingSensor(coordinator, charging_description)
+            for charging_description in CHARGING_SENSOR_DESCRIPTIONS
+        )
+    sensors.extend(
+        ApiMetricSensor(coordinator, metric_description)
+        for metric_description in API_METRIC_SENSOR_DESCRIPTIONS
+    )
 
     async_add_entities(sensors)
 
@@ -239,6 +358,20 @@ class SeatSensor(VehicleCoordinatorBaseEntity, SensorEntity):
         return "mdi:car-seat"
 
 
+class ChargingSensor(VehicleCoordinatorBaseEntity, SensorEntity):
+    """Charging progress estimated from the battery levels reported while charging."""
+
+    entity_description: KiaChargingSensorEntityDescription
+
+    def __init__(self, coordinator: VehicleCoordinator, entity_description: KiaChargingSensorEntityDescription):
+        self.coordinator_fields = entity_description.coordinator_fields
+        super().__init__(coordinator, entity_description)
+
+    @property
+    def native_value(self) -> float | int | None:
+        return getattr(self.coordinator, self.entity_description.key)
+
+
 class APIActionInProgress(VehicleCoordinatorBaseEntity, SensorEntity):
     def __init__(self, coordinator: VehicleCoordinator):
         super().__init__(coordinator, SensorEntityDescription(
@@ -255,3 +388,22 @@ class APIActionInProgress(VehicleCoordinatorBaseEntity, SensorEntity):
     def native_value(self):
         """Return the value reported by the sensor."""
         return self.coordinator.last_action_name if self.coordinator.last_action_name is not None else "None"
+
+
+class ApiMetricSensor(VehicleCoordinatorBaseEntity, SensorEntity):
+    """Diagnostic sensor for the api calls of the vehicle."""
+
+    entity_description: KiaApiMetricSensorEntityDescription
+    coordinator_fields = frozenset((METRICS_FIELD,))
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    @property
+    def native_value(self) -> float | int | None:
+        return self.entity_description.value_fn(self.coordinator.api_connection.metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {
+            **(super().extra_state_attributes or {}),
+            **self.entity_description.attributes_fn(self.coordinator.api_connection.metrics),
+        }
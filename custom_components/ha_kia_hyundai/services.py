@@ -1,16 +1,19 @@
+from datetime import timedelta
 from logging import getLogger
 from typing import cast
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.helpers import device_registry
 
 from .const import DOMAIN, STR_TO_ENUM
 from .vehicle_coordinator import VehicleCoordinator
+from .wake_budget import DEFAULT_MAX_AGE
 
 SERVICE_START_CLIMATE = "start_climate"
 SERVICE_SET_CHARGE_LIMIT = "set_charge_limits"
+SERVICE_REFRESH = "refresh"
 
 SERVICE_ATTRIBUTE_CLIMATE = "climate"
 SERVICE_ATTRIBUTE_TEMPERATURE = "temperature"
@@ -20,10 +23,12 @@ SERVICE_ATTRIBUTE_DRIVER_SEAT = "driver_seat"
 SERVICE_ATTRIBUTE_PASSENGER_SEAT = "passenger_seat"
 SERVICE_ATTRIBUTE_LEFT_REAR_SEAT = "left_rear_seat"
 SERVICE_ATTRIBUTE_RIGHT_REAR_SEAT = "right_rear_seat"
+SERVICE_ATTRIBUTE_MAX_AGE = "max_age"
 
 SUPPORTED_SERVICES = (
     SERVICE_START_CLIMATE,
     SERVICE_SET_CHARGE_LIMIT,
+    SERVICE_REFRESH,
 )
 
 _LOGGER = getLogger(__name__)
@@ -52,8 +57,7 @@ def async_setup_services(hass: HomeAssistant):
         if right_rear_seat is not None:
             right_rear_seat = STR_TO_ENUM[right_rear_seat]
 
-        await coordinator.api_connection.start_climate(
-            vehicle_id=coordinator.vehicle_id,
+        await coordinator.command_coalescer.async_start_climate(
             climate=bool(climate),
             set_temp=set_temp,
             defrost=bool(defrost),
@@ -63,28 +67,46 @@ def async_setup_services(hass: HomeAssistant):
             left_rear_seat=left_rear_seat,
             right_rear_seat=right_rear_seat,
         )
-        coordinator.async_update_listeners()
-        await coordinator.async_request_refresh()
 
     async def async_handle_set_charge_limit(call: ServiceCall):
         coordinator: VehicleCoordinator = _get_coordinator_from_device(hass, call)
         ac_limit = int(call.data.get("ac_limit"))
         dc_limit = int(call.data.get("dc_limit"))
 
-        await coordinator.api_connection.set_charge_limits(
-            vehicle_id=coordinator.vehicle_id,
+        await coordinator.command_coalescer.async_set_charge_limits(
             ac_limit=ac_limit,
             dc_limit=dc_limit
         )
-        coordinator.async_update_listeners()
-        await coordinator.async_request_refresh()
+
+    async def async_handle_refresh(call: ServiceCall) -> ServiceResponse:
+        coordinator: VehicleCoordinator = _get_coordinator_from_device(hass, call)
+        max_age = DEFAULT_MAX_AGE
+        if SERVICE_ATTRIBUTE_MAX_AGE in call.data:
+            max_age = timedelta(minutes=float(call.data[SERVICE_ATTRIBUTE_MAX_AGE]))
+
+        result = await coordinator.wake_budget.async_refresh(max_age)
+        data_age = coordinator.wake_budget.data_age()
+        return {
+            "result": result,
+            "data_age": data_age.total_seconds() if data_age is not None else None,
+            "wake_ups_remaining": coordinator.wake_budget.remaining,
+        }
 
     services = {
         SERVICE_START_CLIMATE: async_handle_start_climate,
         SERVICE_SET_CHARGE_LIMIT: async_handle_set_charge_limit,
+        SERVICE_REFRESH: async_handle_refresh,
+    }
+    supports_response = {
+        SERVICE_REFRESH: SupportsResponse.OPTIONAL,
     }
     for service in SUPPORTED_SERVICES:
-        hass.services.async_register(DOMAIN, service, services[service])
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            services[service],
+            supports_response=supports_response.get(service, SupportsResponse.NONE),
+        )
 
     return True
 
@@ -0,0 +1,77 @@
+"""HTTP sessions owned by the integration, one pooled session per account."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from logging import getLogger
+from typing import Final
+
+from aiohttp import ClientSession, TCPConnector
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util import ssl as ssl_util
+
+_LOGGER = getLogger(__name__)
+
+# every vehicle of an account talks to the same host
+CONNECTION_LIMIT: Final = 8
+KEEPALIVE_TIMEOUT: Final = 60
+DNS_CACHE_TTL: Final = 300
+
+
+class AccountSession:
+    """A keep alive connection pool closed by its owner or when Home Assistant stops.
+
+    Home Assistant's shared session must never be closed by an integration,
+    this one is only used by the UsKia connection of one account.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass: HomeAssistant = hass
+        # calls running on the session and whether it closes once they finished
+        self._calls: int = 0
+        self._close_when_idle: bool = False
+        self.client_session: ClientSession = ClientSession(
+            connector=TCPConnector(
+                limit=CONNECTION_LIMIT,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                ssl=ssl_util.get_default_context(),
+            ),
+            headers={"User-Agent": SERVER_SOFTWARE},
+        )
+        self._unsub_close = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop)
+
+    @contextmanager
+    def in_use(self) -> Iterator[None]:
+        self._calls += 1
+        try:
+            yield
+        finally:
+            self._calls -= 1
+            if self._close_when_idle and self._calls == 0:
+                self._hass.async_create_task(self.async_close())
+
+    @callback
+    def async_close_when_idle(self) -> None:
+        """Close once the calls running on the session finished, e.g. after a new login replaced it."""
+        if self._calls == 0:
+            self._hass.async_create_task(self.async_close())
+        else:
+            self._close_when_idle = True
+
+    async def _async_close_on_stop(self, _event: Event) -> None:
+        self._unsub_close = None
+        await self.client_session.close()
+
+    @callback
+    def _async_stop_listening(self) -> None:
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+
+    async def async_close(self) -> None:
+        self._async_stop_listening()
+        if not self.client_session.closed:
+            _LOGGER.debug("closing account session")
+            await self.client_session.close()
@@ -0,0 +1,62 @@
+"""Monotonic timings of the setup phases of a config entry."""
+
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from time import monotonic
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import CONF_VEHICLE_ID, DOMAIN
+
+
+class SetupTrace:
+    """Duration of each named phase, platforms overlap as they are set up concurrently."""
+
+    def __init__(self) -> None:
+        self._start: float = monotonic()
+        self._end: float | None = None
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = monotonic()
+        try:
+            yield
+        finally:
+            self.phases[name] = (monotonic() - start) * 1000
+
+    def finish(self) -> None:
+        self._end = monotonic()
+
+    @property
+    def total_ms(self) -> float:
+        return ((self._end or monotonic()) - self._start) * 1000
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total_ms": round(self.total_ms),
+            "phases_ms": {name: round(duration_ms) for name, duration_ms in self.phases.items()},
+        }
+
+    def summary(self) -> str:
+        phases = ", ".join(f"{name} {duration_ms:.0f}ms" for name, duration_ms in self.phases.items())
+        return f"{self.total_ms:.0f}ms ({phases})"
+
+
+def traced_platform_setup(
+    setup_entry: Callable[[HomeAssistant, ConfigEntry, AddEntitiesCallback], Coroutine[Any, Any, Any]],
+) -> Callable[[HomeAssistant, ConfigEntry, AddEntitiesCallback], Coroutine[Any, Any, Any]]:
+    """Record the platform async_setup_entry in the setup trace of the vehicle."""
+    platform = setup_entry.__module__.rsplit(".", 1)[-1]
+
+    @wraps(setup_entry)
+    async def wrapper(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
+        coordinator = hass.data[DOMAIN][config_entry.data[CONF_VEHICLE_ID]]
+        with coordinator.setup_trace.phase(f"platform_{platform}"):
+            return await setup_entry(hass, config_entry, async_add_entities)
+
+    return wrapper
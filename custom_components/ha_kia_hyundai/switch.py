@@ -10,21 +10,23 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from . import VehicleCoordinator
 from .const import DOMAIN
 from .vehicle_coordinator_base_entity import VehicleCoordinatorBaseEntity
+from .setup_trace import traced_platform_setup
 
 _LOGGER = getLogger(__name__)
 PARALLEL_UPDATES: int = 1
 
 
+@traced_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
     vehicle_id = config_entry.unique_id
     coordinator: VehicleCoordinator = hass.data[DOMAIN][vehicle_id]
 
-    switches: [SwitchEntity] = [
-        ChargingSwitch(coordinator=coordinator),
-    ]
-    if coordinator.can_remote_climate:
+    switches: [SwitchEntity] = []
+    if coordinator.capabilities.has("ev_plugged_in"):
+        switches.append(ChargingSwitch(coordinator=coordinator))
+    if coordinator.capabilities.remote_climate:
         _LOGGER.debug("Adding climate related switch entities")
         switches.append(ClimateDesiredDefrostSwitch(coordinator=coordinator))
         switches.append(ClimateDesiredHeatingAccSwitch(coordinator=coordinator))
@@ -34,6 +36,8 @@ async def async_setup_entry(
 
 
 class ClimateDesiredDefrostSwitch(VehicleCoordinatorBaseEntity, SwitchEntity, RestoreEntity):
+    coordinator_fields = frozenset()
+
     def __init__(
             self,
             coordinator: VehicleCoordinator,
@@ -72,6 +76,8 @@ class ClimateDesiredDefrostSwitch(VehicleCoordinatorBaseEntity, SwitchEntity, Re
 
 
 class ClimateDesiredHeatingAccSwitch(VehicleCoordinatorBaseEntity, SwitchEntity, RestoreEntity):
+    coordinator_fields = frozenset()
+
     def __init__(
             self,
             coordinator: VehicleCoordinator
@@ -109,6 +115,8 @@ class ClimateDesiredHeatingAccSwitch(VehicleCoordinatorBaseEntity, SwitchEntity,
         self.coordinator.climate_desired_heating_acc = state == STATE_ON
 
 class ChargingSwitch(VehicleCoordinatorBaseEntity, SwitchEntity):
+    coordinator_fields = frozenset(("ev_battery_charging", "ev_plugged_in"))
+
     def __init__(
             self,
             coordinator: VehicleCoordinator,
@@ -129,11 +137,7 @@ class ChargingSwitch(VehicleCoordinatorBaseEntity, SwitchEntity):
         return self.coordinator.ev_battery_charging
 
     async def async_turn_on(self, **kwargs: any) -> None:
-        await self.coordinator.api_connection.start_charge(vehicle_id=self.coordinator.vehicle_id)
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.command_queue.async_run("start_charge")
 
     async def async_turn_off(self, **kwargs: any) -> None:
-        await self.coordinator.api_connection.stop_charge(vehicle_id=self.coordinator.vehicle_id)
-        self.coordinator.async_update_listeners()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.command_queue.async_run("stop_charge")
@@ -0,0 +1,121 @@
+"""Fixed size history of the numeric fields of a vehicle for trend queries."""
+
+from typing import Any, Final
+
+import numpy as np
+
+from .vehicle_snapshot import VehicleSnapshot
+
+TELEMETRY_FIELDS: Final = (
+    "ev_battery_level",
+    "fuel_level",
+    "odometer_value",
+    "car_battery_level",
+    "ev_remaining_range_value",
+    "fuel_remaining_range_value",
+    "total_remaining_range_value",
+)
+# samples kept per vehicle, a week of 15 minute polls plus the faster ones while charging
+TELEMETRY_SIZE: Final = 1024
+SECONDS_PER_HOUR: Final = 3600
+
+
+class TelemetryBuffer:
+    """Ring buffer of timestamped samples, one float64 column per field and NaN where unreported.
+
+    Samples are keyed by the time the vehicle synced to the cloud, so the same
+    cached status polled twice is stored once.
+    """
+
+    def __init__(self, fields: tuple[str, ...] = TELEMETRY_FIELDS, size: int = TELEMETRY_SIZE) -> None:
+        self.fields: tuple[str, ...] = fields
+        self._columns: dict[str, int] = {name: column for column, name in enumerate(fields)}
+        self._times: np.ndarray = np.zeros(size)
+        self._values: np.ndarray = np.full((size, len(fields)), np.nan)
+        self._next: int = 0
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_time(self) -> float | None:
+        if self._count == 0:
+            return None
+        return float(self._times[self._next - 1])
+
+    def append(self, timestamp: float, values: tuple[float | None, ...]) -> bool:
+        """Store a sample, return false if it is not newer than the last one."""
+        last_time = self.last_time
+        if last_time is not None and timestamp <= last_time:
+            return False
+        self._times[self._next] = timestamp
+        self._values[self._next] = [np.nan if value is None else value for value in values]
+        self._next = (self._next + 1) % len(self._times)
+        self._count = min(self._count + 1, len(self._times))
+        return True
+
+    def append_snapshot(self, snapshot: VehicleSnapshot) -> bool:
+        synced = snapshot.last_synced_to_cloud
+        if synced is None:
+            return False
+        return self.append(synced.timestamp(), tuple(getattr(snapshot, name) for name in self.fields))
+
+    def _ordered(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the times and values oldest first."""
+        if self._count < len(self._times):
+            return self._times[:self._count], self._values[:self._count]
+        return np.roll(self._times, -self._next), np.roll(self._values, -self._next, axis=0)
+
+    def window(self, field: str, seconds: float) -> tuple[np.ndarray, np.ndarray]:
+        """Return the reported times and values of the field within seconds of the last sample."""
+        if self._count == 0:
+            return np.empty(0), np.empty(0)
+        times, values = self._ordered()
+        start = np.searchsorted(times, times[-1] - seconds)
+        times = times[start:]
+        values = values[start:, self._columns[field]]
+        reported = ~np.isnan(values)
+        return times[reported], values[reported]
+
+    def delta(self, field: str, seconds: float) -> float | None:
+        """Return the change of the field over the window."""
+        _, values = self.window(field, seconds)
+        if len(values) < 2:
+            return None
+        return float(values[-1] - values[0])
+
+    def slope(self, field: str, seconds: float) -> float | None:
+        """Return the least squares change of the field per hour over the window."""
+        times, values = self.window(field, seconds)
+        if len(values) < 2:
+            return None
+        centered = times - times.mean()
+        variance = np.dot(centered, centered)
+        if variance == 0:
+            return None
+        return float(np.dot(centered, values - values.mean()) / variance * SECONDS_PER_HOUR)
+
+    def mean(self, field: str, seconds: float) -> float | None:
+        _, values = self.window(field, seconds)
+        if len(values) == 0:
+            return None
+        return float(values.mean())
+
+    def rolling_mean(self, field: str, seconds: float, samples: int) -> np.ndarray:
+        """Return the means of every run of samples reported values within the window."""
+        _, values = self.window(field, seconds)
+        if len(values) < samples:
+            return np.empty(0)
+        sums = np.cumsum(np.concatenate(([0.0], values)))
+        return (sums[samples:] - sums[:-samples]) / samples
+
+    def as_dict(self, seconds: float = SECONDS_PER_HOUR) -> dict[str, Any]:
+        return {
+            "samples": self._count,
+            "capacity": len(self._times),
+            "fields": {
+                name: {"delta": self.delta(name, seconds), "slope_per_hour": self.slope(name, seconds)}
+                for name in self.fields
+            },
+        }
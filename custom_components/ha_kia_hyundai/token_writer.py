@@ -0,0 +1,93 @@
+"""Write rotated refresh tokens and the device id back to the config entries."""
+
+from logging import getLogger
+from typing import TYPE_CHECKING, Final
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CONF_DEVICE_ID, CONF_REFRESH_TOKEN
+
+if TYPE_CHECKING:
+    from .account import KiaAccount
+
+_LOGGER = getLogger(__name__)
+
+# rotations within this window are written together
+WRITE_DELAY: Final = 5
+
+
+class TokenWriter:
+    """Batch token changes of an account into config entry data updates."""
+
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            account: "KiaAccount",
+            refresh_token: str | None,
+            device_id: str | None,
+    ) -> None:
+        self._hass = hass
+        self._account = account
+        self._written: tuple[str | None, str | None] = (refresh_token, device_id)
+        self._unsub_write: CALLBACK_TYPE | None = None
+        self._unsub_stop: CALLBACK_TYPE = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_stop
+        )
+
+    def _current(self) -> tuple[str | None, str | None]:
+        api_connection = self._account.api_connection
+        return api_connection.refresh_token, api_connection.device_id
+
+    @callback
+    def async_check(self) -> None:
+        """Schedule a write if the tokens changed since the last write."""
+        if self._unsub_write is not None or self._current() == self._written:
+            return
+        self._unsub_write = async_call_later(self._hass, WRITE_DELAY, self._async_write)
+
+    @callback
+    def _async_write(self, _now=None) -> None:
+        self._unsub_write = None
+        refresh_token, device_id = current = self._current()
+        if current == self._written:
+            return
+        _LOGGER.debug(f"writing rotated tokens to {len(self._account.entry_ids)} entries")
+        for entry_id in self._account.entry_ids:
+            config_entry = self._hass.config_entries.async_get_entry(entry_id)
+            if config_entry is None:
+                continue
+            if (
+                config_entry.data.get(CONF_REFRESH_TOKEN) == refresh_token
+                and config_entry.data.get(CONF_DEVICE_ID) == device_id
+            ):
+                continue
+            self._hass.config_entries.async_update_entry(
+                config_entry,
+                data={
+                    **config_entry.data,
+                    CONF_REFRESH_TOKEN: refresh_token,
+                    CONF_DEVICE_ID: device_id,
+                },
+            )
+        self._written = current
+
+    @callback
+    def async_flush(self) -> None:
+        """Write any pending change now."""
+        if self._unsub_write is not None:
+            self._unsub_write()
+        self._async_write()
+
+    @callback
+    def _async_stop(self, _event: Event) -> None:
+        self._unsub_stop = None
+        self.async_flush()
+
+    @callback
+    def async_close(self) -> None:
+        self.async_flush()
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
@@ -31,6 +31,10 @@ def safely_get_json_value(json, key, callable_to_cast=None):
                     value = value[int(x)]
                 except (TypeError, KeyError, ValueError):
                     value = None
+    return cast_json_value(value, callable_to_cast)
+
+
+def cast_json_value(value, callable_to_cast=None):
     if callable_to_cast is not None and value is not None:
         if callable_to_cast is bool and type(value) is str and value.isdigit():
             value = int(value)
@@ -1,26 +1,50 @@
-from asyncio import sleep
-from datetime import timedelta, datetime
+from collections.abc import Iterable
+from datetime import datetime, timedelta
 from logging import getLogger
+from time import monotonic
 
-from aiohttp import ClientError
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.util import dt as dt_util
-from homeassistant.core import HomeAssistant
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, REQUEST_REFRESH_DEFAULT_COOLDOWN
-from kia_hyundai_api import UsKia
 
 from custom_components.ha_kia_hyundai import DOMAIN
 from custom_components.ha_kia_hyundai.const import (
-    DELAY_BETWEEN_ACTION_IN_PROGRESS_CHECKING,
-    TEMPERATURE_MAX,
-    TEMPERATURE_MIN
+    CONF_DAILY_WAKE_UPS,
+    CONF_MAX_STALENESS,
+    DEFAULT_DAILY_WAKE_UPS,
+    DEFAULT_MAX_STALENESS,
 )
-from custom_components.ha_kia_hyundai.util import safely_get_json_value, convert_last_updated_str_to_datetime
+from custom_components.ha_kia_hyundai.account import VehicleConnection
+from custom_components.ha_kia_hyundai.action_tracker import ActionTracker
+from custom_components.ha_kia_hyundai.api_metrics import METRICS_FIELD
+from custom_components.ha_kia_hyundai.capabilities import CapabilityProfile
+from custom_components.ha_kia_hyundai.charging import PLUG_TYPE_DC, ChargeRateEstimator, minutes_to_target
+from custom_components.ha_kia_hyundai.command_coalescer import CommandCoalescer
+from custom_components.ha_kia_hyundai.command_queue import METHOD_GROUP, CommandQueue
+from custom_components.ha_kia_hyundai.optimistic_overlay import OptimisticOverlay
+from custom_components.ha_kia_hyundai.polling_policy import PollingPolicy
+from custom_components.ha_kia_hyundai.refresh_history import RefreshHistory
+from custom_components.ha_kia_hyundai.setup_trace import SetupTrace
+from custom_components.ha_kia_hyundai.telemetry import TelemetryBuffer
+from custom_components.ha_kia_hyundai.util import safely_get_json_value
+from custom_components.ha_kia_hyundai.vehicle_snapshot import FIELD_NAMES, VehicleSnapshot, build_snapshot
+from custom_components.ha_kia_hyundai.vehicle_store import VehicleStore
+from custom_components.ha_kia_hyundai.wake_budget import WakeBudget
 from kia_hyundai_api.const import SeatSettings
 
 _LOGGER = getLogger(__name__)
 
+# retry at least this often while serving stale data
+STALE_RETRY_INTERVAL = timedelta(minutes=5)
+SERVING_FRESH = "fresh"
+SERVING_STALE = "stale"
+SERVING_EXPIRED = "expired"
+
 
 class VehicleCoordinator(DataUpdateCoordinator):
     """Kia Us device object."""
@@ -39,14 +63,46 @@ class VehicleCoordinator(DataUpdateCoordinator):
             vehicle_id: str,
             vehicle_name: str,
             vehicle_model: str,
-            api_connection: UsKia,
-            scan_interval: timedelta,
+            api_connection: VehicleConnection,
+            polling_policy: PollingPolicy,
+            store: VehicleStore,
+            setup_trace: SetupTrace | None = None,
     ) -> None:
         """Initialize the device."""
         self.vehicle_id: str = vehicle_id
         self.vehicle_name: str = vehicle_name
         self.vehicle_model: str = vehicle_model
-        self.api_connection: UsKia = api_connection
+        self.api_connection: VehicleConnection = api_connection
+        # as reported by the vehicle, snapshot adds the expected results of sent commands
+        self.reported_snapshot: VehicleSnapshot = VehicleSnapshot()
+        self.snapshot: VehicleSnapshot = VehicleSnapshot()
+        self.optimistic: OptimisticOverlay = OptimisticOverlay()
+        # None means every field may have changed
+        self.changed_fields: frozenset[str] | None = None
+        self.polling_policy: PollingPolicy = polling_policy
+        self.action_tracker: ActionTracker = ActionTracker(self)
+        self.command_queue: CommandQueue = CommandQueue(self)
+        self.command_coalescer: CommandCoalescer = CommandCoalescer(self)
+        self.wake_budget: WakeBudget = WakeBudget(
+            self, config_entry.options.get(CONF_DAILY_WAKE_UPS, DEFAULT_DAILY_WAKE_UPS)
+        )
+        self.store: VehicleStore = store
+        self.refresh_history: RefreshHistory = RefreshHistory()
+        self.setup_trace: SetupTrace = setup_trace or SetupTrace()
+        self.telemetry: TelemetryBuffer = TelemetryBuffer()
+        self.charge_rate: ChargeRateEstimator = ChargeRateEstimator()
+        self.entry_options: dict[str, any] = dict(config_entry.options)
+        self.max_staleness: timedelta = timedelta(
+            minutes=config_entry.options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        )
+        # time of the last successful refresh and when each field was last reported by one
+        self.last_success: datetime | None = None
+        self.field_confirmed: dict[str, datetime] = {}
+        self._unsub_expiry: CALLBACK_TYPE | None = None
+        self.capabilities: CapabilityProfile = CapabilityProfile()
+        # the profile the platforms and entities were set up from
+        self.loaded_capabilities: CapabilityProfile | None = None
+        self.platforms: list[Platform] = []
         request_refresh_debouncer = Debouncer(
             hass,
             _LOGGER,
@@ -55,23 +111,46 @@ class VehicleCoordinator(DataUpdateCoordinator):
         )
 
         async def refresh() -> dict[str, any]:
-            while self.last_action_name is not None:
-                try:
-                    await self.api_connection.check_last_action_finished(vehicle_id=vehicle_id)
-                except ClientError as err:
-                    _LOGGER.error(err)
-                if self.last_action_name is not None:
-                    _LOGGER.debug(
-                        f"requesting another update due to in progress action {self.api_connection.last_action}"
-                    )
-                    await sleep(DELAY_BETWEEN_ACTION_IN_PROGRESS_CHECKING)
-                else:
-                    _LOGGER.debug(f"action finished! {self.api_connection.last_action}")
-            new_data = await self.api_connection.get_cached_vehicle_status(vehicle_id=vehicle_id)
+            start = monotonic()
+            try:
+                new_data = await self.api_connection.get_cached_vehicle_status()
+            except Exception as err:
+                self.refresh_history.record_error(err, (monotonic() - start) * 1000)
+                # entities are only written when they turn stale or expire
+                self.changed_fields = frozenset((METRICS_FIELD,))
+                if self.update_interval > STALE_RETRY_INTERVAL:
+                    # the polling policy restores the interval after the next success
+                    self.update_interval = STALE_RETRY_INTERVAL
+                raise
             target_soc = safely_get_json_value(new_data, "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.targetSOC")
             if target_soc is not None:
                 target_soc.sort(key=lambda x: x["plugType"])
             new_data["last_action_status"] = self.api_connection.last_action
+            reported = build_snapshot(new_data)
+            now = dt_util.utcnow()
+            self._async_confirm(reported, now)
+            reconciled_fields = self.optimistic.reconcile(reported)
+            snapshot = self.optimistic.apply(reported)
+            changed_fields = {*snapshot.changed_fields(self.snapshot), *reconciled_fields, METRICS_FIELD}
+            if self._update_charge_rate(reported):
+                changed_fields.add("ev_charge_rate")
+            self.changed_fields = frozenset(changed_fields)
+            self.reported_snapshot = reported
+            self.snapshot = snapshot
+            self.telemetry.append_snapshot(reported)
+            self.capabilities = self.capabilities.merge(CapabilityProfile.from_snapshot(reported))
+            if self.loaded_capabilities is not None and self.capabilities != self.loaded_capabilities:
+                _LOGGER.info(f"{self.vehicle_name} reported new capabilities, reloading to add their entities")
+                self.loaded_capabilities = None
+                self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+            update_interval = self.polling_policy.next_interval(reported, now)
+            if update_interval != self.update_interval:
+                _LOGGER.debug(f"polling interval changed to {update_interval}")
+                self.update_interval = update_interval
+            self.store.async_save(self.vehicle_name, self.vehicle_model, new_data, self.capabilities.as_dict(), now)
+            duration_ms = (monotonic() - start) * 1000
+            self.api_connection.metrics.record_refresh(duration_ms, len(json_bytes(new_data)))
+            self.refresh_history.record(new_data, duration_ms)
             return new_data
 
         super().__init__(
@@ -79,11 +158,125 @@ class VehicleCoordinator(DataUpdateCoordinator):
             _LOGGER,
             config_entry=config_entry,
             name=f"{DOMAIN}-{self.vehicle_name}",
-            update_interval=scan_interval,
+            update_interval=polling_policy.default_interval,
             update_method=refresh,
             request_refresh_debouncer=request_refresh_debouncer,
-            always_update=False
-        )
+            always_update=True,
+        )
+
+    def _update_charge_rate(self, reported: VehicleSnapshot) -> bool:
+        synced = reported.last_synced_to_cloud
+        return self.charge_rate.update(
+            synced.timestamp() if synced is not None else None,
+            reported.ev_battery_level,
+            reported.ev_battery_charging,
+        )
+
+    @callback
+    def _async_confirm(self, reported: VehicleSnapshot, refreshed_at: datetime) -> None:
+        """Record the reported fields as current and schedule their expiry."""
+        self.last_success = refreshed_at
+        self.field_confirmed.update(
+            (name, refreshed_at) for name in FIELD_NAMES if getattr(reported, name) is not None
+        )
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+        # just past the limit, failed retries within it do not notify the entities
+        delay = (refreshed_at + self.max_staleness - dt_util.utcnow()).total_seconds() + 1
+        self._unsub_expiry = async_call_later(self.hass, max(0.0, delay), self._async_expire)
+
+    @callback
+    def _async_expire(self, _now: datetime) -> None:
+        self._unsub_expiry = None
+        if self.serving_mode == SERVING_EXPIRED:
+            _LOGGER.debug(f"no successful refresh within {self.max_staleness}, values expired")
+            self.async_notify_fields(())
+
+    @callback
+    def async_restore(
+            self,
+            data: dict[str, any],
+            capabilities: dict[str, any] | None,
+            refreshed_at: datetime | None = None,
+    ) -> None:
+        """Serve a previously stored payload until the first live refresh lands."""
+        self.reported_snapshot = self.snapshot = build_snapshot(data)
+        # stores written before the refresh time was kept only know when the car synced
+        refreshed_at = refreshed_at or self.snapshot.last_synced_to_cloud
+        if refreshed_at is not None:
+            self._async_confirm(self.snapshot, refreshed_at)
+        self.telemetry.append_snapshot(self.snapshot)
+        self._update_charge_rate(self.snapshot)
+        self.changed_fields = None
+        self.capabilities = CapabilityProfile.from_snapshot(self.snapshot)
+        if capabilities is not None:
+            self.capabilities = self.capabilities.merge(CapabilityProfile.from_dict(capabilities))
+        self.async_set_updated_data(data)
+
+    @property
+    def serving_mode(self) -> str:
+        """Return whether entities show fresh data, the last good data or nothing."""
+        if self.last_update_success:
+            return SERVING_FRESH
+        if self.last_success is not None and dt_util.utcnow() - self.last_success <= self.max_staleness:
+            return SERVING_STALE
+        return SERVING_EXPIRED
+
+    def last_confirmed(self, fields: Iterable[str]) -> datetime | None:
+        """Return when the oldest of the fields was last reported by a successful refresh."""
+        confirmed = [self.field_confirmed[name] for name in fields if name in self.field_confirmed]
+        return min(confirmed) if confirmed else self.last_success
+
+    def has_changed(self, fields: frozenset[str]) -> bool:
+        """Return true if any of the fields changed in the last update."""
+        return self.changed_fields is None or not self.changed_fields.isdisjoint(fields)
+
+    @callback
+    def async_notify_fields(self, fields: Iterable[str]) -> None:
+        """Update only the entities bound to the given fields."""
+        self.changed_fields = frozenset(fields)
+        self.async_update_listeners()
+
+    @callback
+    def async_track_action(self) -> None:
+        """Show the started action and refresh in the background once it finishes."""
+        self.async_notify_fields(("last_action_name",))
+        self.action_tracker.async_track()
+
+    @callback
+    def async_expect(self, method: str, kwargs: dict[str, any]) -> None:
+        """Show the outcome of a command right away, the next refreshes confirm or revert it."""
+        fields = self.optimistic.expect(METHOD_GROUP[method], method, kwargs)
+        self._async_apply_overlay(fields)
+
+    @callback
+    def async_command_sent(self, method: str) -> None:
+        self.optimistic.mark_sent(METHOD_GROUP[method], method)
+
+    @callback
+    def async_command_failed(self, method: str) -> None:
+        """Revert the expected outcome of a command the api rejected."""
+        fields = self.optimistic.discard(METHOD_GROUP[method], method)
+        self._async_apply_overlay(fields)
+
+    @callback
+    def _async_apply_overlay(self, fields: set[str]) -> None:
+        if not fields:
+            return
+        self.snapshot = self.optimistic.apply(self.reported_snapshot)
+        self.async_notify_fields(fields)
+
+    def transition(self, method_group: str) -> str | None:
+        """Return e.g. locking while a command of the group is not confirmed yet."""
+        return self.optimistic.transition(method_group)
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        self.command_coalescer.async_cancel()
+        self.command_queue.async_cancel()
+        await super().async_shutdown()
 
     @property
     def id(self) -> str:
@@ -92,11 +285,11 @@ class VehicleCoordinator(DataUpdateCoordinator):
 
     @property
     def can_remote_lock(self) -> bool:
-        return safely_get_json_value(self.data, "vehicleConfig.vehicleFeature.remoteFeature.lock", bool)
+        return self.snapshot.can_remote_lock
 
     @property
     def doors_locked(self) -> bool:
-        return safely_get_json_value(self.data, "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.doorLock", bool)
+        return self.snapshot.doors_locked
 
     @property
     def last_action_name(self) -> str:
@@ -105,345 +298,194 @@ class VehicleCoordinator(DataUpdateCoordinator):
 
     @property
     def latitude(self) -> float:
-        return safely_get_json_value(self.data, "lastVehicleInfo.location.coord.lat", float)
+        return self.snapshot.latitude
 
     @property
     def longitude(self) -> float:
-        return safely_get_json_value(self.data, "lastVehicleInfo.location.coord.lon", float)
+        return self.snapshot.longitude
+
+    @property
+    def location_synced(self) -> datetime:
+        return self.snapshot.location_synced
 
     @property
     def ev_battery_level(self) -> float:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.batteryStatus",
-            int
-        )
+        return self.snapshot.ev_battery_level
 
     @property
     def odometer_value(self) -> float:
-        return safely_get_json_value(self.data, "vehicleConfig.vehicleDetail.vehicle.mileage", int)
+        return self.snapshot.odometer_value
 
     @property
     def car_battery_level(self) -> int:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.batteryStatus.stateOfCharge",
-            int
-        )
+        return self.snapshot.car_battery_level
 
     @property
     def last_synced_to_cloud(self) -> datetime:
-        return convert_last_updated_str_to_datetime(
-            last_updated_str=safely_get_json_value(
-                self.data,
-                "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.syncDate.utc"
-            ),
-            timezone_of_str=dt_util.UTC,
-        )
+        return self.snapshot.last_synced_to_cloud
 
     @property
     def last_synced_from_cloud(self) -> datetime:
-        return convert_last_updated_str_to_datetime(
-            last_updated_str=safely_get_json_value(
-                self.data,
-                "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.dateTime.utc"
-            ),
-            timezone_of_str=dt_util.UTC,
-        )
+        return self.snapshot.last_synced_from_cloud
 
     @property
     def next_service_mile_value(self) -> float:
-        return safely_get_json_value(
-            self.data,
-            "vehicleConfig.maintenance.nextServiceMile",
-            float
-        )
+        return self.snapshot.next_service_mile_value
 
     @property
     def can_remote_climate(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "vehicleConfig.vehicleFeature.remoteFeature.start",
-            bool
-        )
+        return self.snapshot.can_remote_climate
 
     @property
     def climate_hvac_on(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.airCtrl",
-            bool
-        )
+        return self.snapshot.climate_hvac_on
 
     @property
     def climate_temperature_value(self) -> int:
-        temperature = safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.airTemp.value",
-        )
-        if temperature == "LOW":
-            return TEMPERATURE_MIN
-        if temperature == "HIGH":
-            return TEMPERATURE_MAX
-        if temperature is not None:
-            temperature = int(temperature)
-        return temperature
+        return self.snapshot.climate_temperature_value
 
     @property
     def climate_defrost_on(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.defrost",
-            bool
-        )
+        return self.snapshot.climate_defrost_on
 
     @property
     def climate_heated_rear_window_on(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.heatingAccessory.rearWindow",
-            bool
-        )
+        return self.snapshot.climate_heated_rear_window_on
 
     @property
     def climate_heated_side_mirror_on(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.heatingAccessory.sideMirror",
-            bool
-        )
+        return self.snapshot.climate_heated_side_mirror_on
 
     @property
     def climate_heated_steering_wheel_on(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.heatingAccessory.steeringWheel",
-            bool
-        )
+        return self.snapshot.climate_heated_steering_wheel_on
 
     @property
     def door_hood_open(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.doorStatus.hood",
-            bool
-        )
+        return self.snapshot.door_hood_open
 
     @property
     def door_trunk_open(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.doorStatus.trunk",
-            bool
-        )
+        return self.snapshot.door_trunk_open
 
     @property
     def door_front_left_open(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.doorStatus.frontLeft",
-            bool
-        )
+        return self.snapshot.door_front_left_open
 
     @property
     def door_front_right_open(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.doorStatus.frontRight",
-            bool
-        )
+        return self.snapshot.door_front_right_open
 
     @property
     def door_back_left_open(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.doorStatus.backLeft",
-            bool
-        )
+        return self.snapshot.door_back_left_open
 
     @property
     def door_back_right_open(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.doorStatus.backRight",
-            bool
-        )
+        return self.snapshot.door_back_right_open
 
     @property
     def engine_on(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.engine",
-            bool
-        )
+        return self.snapshot.engine_on
 
     @property
     def tire_all_on(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.tirePressure.all",
-            bool
-        )
+        return self.snapshot.tire_all_on
 
     @property
     def low_fuel_light_on(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.lowFuelLight",
-            bool
-        )
+        return self.snapshot.low_fuel_light_on
 
     @property
     def fuel_level(self) -> float:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.fuelLevel",
-            float
-        )
+        return self.snapshot.fuel_level
 
     @property
     def ev_battery_charging(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.batteryCharge",
-            bool
-        )
+        return self.snapshot.ev_battery_charging
 
     @property
     def ev_plugged_in(self) -> bool:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.batteryPlugin",
-            bool
-        )
+        return self.snapshot.ev_plugged_in
 
     @property
     def ev_charge_limits_ac(self) -> int:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.targetSOC.1.targetSOClevel",
-            int
-        )
+        return self.snapshot.ev_charge_limits_ac
 
     @property
     def ev_charge_limits_dc(self) -> int:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.targetSOC.0.targetSOClevel",
-            int
-        )
+        return self.snapshot.ev_charge_limits_dc
+
+    @property
+    def ev_plug_type(self) -> int:
+        return self.snapshot.ev_plug_type
+
+    @property
+    def ev_charge_rate(self) -> float | None:
+        """Return the estimated charge rate in %/h while charging."""
+        return self.charge_rate.rate
+
+    @property
+    def ev_charge_target(self) -> int | None:
+        """Return the limit of the connected charger type."""
+        if self.ev_plug_type == PLUG_TYPE_DC:
+            return self.ev_charge_limits_dc
+        return self.ev_charge_limits_ac
+
+    @property
+    def ev_charge_time_to_target(self) -> int | None:
+        """Return the estimated minutes until the charge limit is reached."""
+        if not self.ev_battery_charging:
+            return None
+        return minutes_to_target(self.ev_battery_level, self.ev_charge_target, self.ev_charge_rate)
 
     @property
     def ev_charge_current_remaining_duration(self) -> int:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.remainChargeTime.0.timeInterval.value",
-            int
-        )
+        return self.snapshot.ev_charge_current_remaining_duration
 
     @property
     def ev_remaining_range_value(self) -> int:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.drvDistance.0.rangeByFuel.evModeRange.value",
-            int
-        )
+        return self.snapshot.ev_remaining_range_value
 
     @property
     def fuel_remaining_range_value(self) -> int:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.drvDistance.0.rangeByFuel.gasModeRange.value",
-            int
-        ) or safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.distanceToEmpty.value",
-            int
-        )
+        return self.snapshot.fuel_remaining_range_value
 
     @property
     def total_remaining_range_value(self) -> int:
-        return safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.evStatus.drvDistance.0.rangeByFuel.totalAvailableRange.value",
-            int
-        ) or safely_get_json_value(
-            self.data,
-            "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.distanceToEmpty.value",
-            int
-        )
+        return self.snapshot.total_remaining_range_value
 
     @property
     def has_climate_seats(self) -> bool:
         """Return true if heated or cooled seats installed."""
-        return safely_get_json_value(
-            self.data,
-            "vehicleConfig.vehicleFeature.remoteFeature.heatedSeat",
-            bool,
-        ) or safely_get_json_value(
-            self.data,
-            "vehicleConfig.vehicleFeature.remoteFeature.ventSeat",
-            bool,
-        )
+        return self.snapshot.has_climate_seats
 
     @property
     def front_seat_options(self) -> dict:
         """Return front seat options."""
-        return safely_get_json_value(
-            self.data,
-            "vehicleConfig.heatVentSeat.driverSeat",
-            dict,
-        )
+        return self.snapshot.front_seat_options
 
     @property
     def rear_seat_options(self) -> dict:
         """Return rear seat options."""
-        return safely_get_json_value(
-            self.data,
-            "vehicleConfig.heatVentSeat.rearLeftSeat",
-            dict,
-        )
+        return self.snapshot.rear_seat_options
 
     @property
     def climate_driver_seat(self) -> tuple:
         """Get the status of the left front seat."""
-        return tuple(
-            safely_get_json_value(
-                self.data,
-                "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.heatVentSeat.driverSeat",
-                dict,
-            ).values()
-        )
+        return self.snapshot.climate_driver_seat
 
     @property
     def climate_passenger_seat(self) -> tuple:
         """Get the status of the right front seat."""
-        return tuple(
-            safely_get_json_value(
-                self.data,
-                "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.heatVentSeat.passengerSeat",
-                dict,
-            ).values()
-        )
+        return self.snapshot.climate_passenger_seat
 
     @property
     def climate_left_rear_seat(self) -> tuple:
         """Get the status of the left rear seat."""
-        return tuple(
-            safely_get_json_value(
-                self.data,
-                "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.heatVentSeat.rearLeftSeat",
-                dict,
-            ).values()
-        )
+        return self.snapshot.climate_left_rear_seat
 
     @property
     def climate_right_rear_seat(self) -> tuple:
         """Get the status of the right rear seat."""
-        return tuple(
-            safely_get_json_value(
-                self.data,
-                "lastVehicleInfo.vehicleStatusRpt.vehicleStatus.climate.heatVentSeat.rearRightSeat",
-                dict,
-            ).values()
-        )
+        return self.snapshot.climate_right_rear_seat
@@ -1,5 +1,7 @@
 import logging
+from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -7,16 +9,57 @@ from homeassistant.helpers.update_coordinator import (
 
 from . import VehicleCoordinator
 from .const import DOMAIN
+from .vehicle_coordinator import SERVING_EXPIRED, SERVING_STALE
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class VehicleCoordinatorBaseEntity(CoordinatorEntity[VehicleCoordinator]):
+    # coordinator fields the state depends on, defaults to the description key
+    coordinator_fields: frozenset[str] | None = None
+    _unrecorded_attributes = frozenset({"stale", "last_confirmed"})
+
     def __init__(self, coordinator: VehicleCoordinator, entity_description: EntityDescription):
         super().__init__(coordinator)
         self.entity_description = entity_description
         self._attr_unique_id = f"{DOMAIN}-{coordinator.vehicle_id}-{self.entity_description.key}"
         self._attr_name = f"{coordinator.vehicle_name} {self.entity_description.name}"
+        if self.coordinator_fields is None:
+            self.coordinator_fields = frozenset((entity_description.key,))
+        self._serving_mode: str = coordinator.serving_mode
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Skip the state write unless the serving mode or a bound field changed.
+
+        Failed refreshes within the max staleness keep the last values, so a
+        cloud hiccup is one write into and one out of stale, not unavailable.
+        """
+        serving_mode = self.coordinator.serving_mode
+        # fields first, entities may track state in _has_changed
+        if (
+            self._has_changed()
+            or serving_mode != self._serving_mode
+        ):
+            self._serving_mode = serving_mode
+            super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        return self.coordinator.serving_mode != SERVING_EXPIRED
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        if self.coordinator.serving_mode != SERVING_STALE:
+            return None
+        last_confirmed = self.coordinator.last_confirmed(self.coordinator_fields or ())
+        return {
+            "stale": True,
+            "last_confirmed": last_confirmed.isoformat() if last_confirmed is not None else None,
+        }
+
+    def _has_changed(self) -> bool:
+        return self.coordinator.has_changed(self.coordinator_fields)
 
     @property
     def device_info(self):
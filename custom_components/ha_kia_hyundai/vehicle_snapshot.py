@@ -0,0 +1,199 @@
+"""Compiled single pass extraction of the cached vehicle status payload.
+
+Every field the integration reads is declared once in FIELDS. The dotted
+paths are compiled into a trie at import time so a refresh walks the raw
+payload a single time and stores the results in a slotted VehicleSnapshot,
+which the coordinator properties read without touching the payload again.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Final
+
+from homeassistant.util import dt as dt_util
+
+from .const import TEMPERATURE_MAX, TEMPERATURE_MIN
+from .util import cast_json_value, convert_last_updated_str_to_datetime
+
+STATUS: Final = "lastVehicleInfo.vehicleStatusRpt.vehicleStatus"
+EV_STATUS: Final = f"{STATUS}.evStatus"
+REMOTE_FEATURE: Final = "vehicleConfig.vehicleFeature.remoteFeature"
+
+
+@dataclass(frozen=True)
+class SnapshotField:
+    """A value extracted from the payload, paths are tried in order like `or`."""
+
+    name: str
+    paths: tuple[str, ...]
+    cast: Callable[[Any], Any] | None = None
+
+
+def _utc_datetime(value):
+    return convert_last_updated_str_to_datetime(
+        last_updated_str=value,
+        timezone_of_str=dt_util.UTC,
+    )
+
+
+def _temperature(value):
+    if value == "LOW":
+        return TEMPERATURE_MIN
+    if value == "HIGH":
+        return TEMPERATURE_MAX
+    return int(value)
+
+
+def _seat(value):
+    return tuple(dict(value).values())
+
+
+FIELDS: Final[tuple[SnapshotField, ...]] = (
+    SnapshotField("can_remote_lock", (f"{REMOTE_FEATURE}.lock",), bool),
+    SnapshotField("can_remote_climate", (f"{REMOTE_FEATURE}.start",), bool),
+    SnapshotField("has_climate_seats", (f"{REMOTE_FEATURE}.heatedSeat", f"{REMOTE_FEATURE}.ventSeat"), bool),
+    SnapshotField("front_seat_options", ("vehicleConfig.heatVentSeat.driverSeat",), dict),
+    SnapshotField("rear_seat_options", ("vehicleConfig.heatVentSeat.rearLeftSeat",), dict),
+    SnapshotField("odometer_value", ("vehicleConfig.vehicleDetail.vehicle.mileage",), int),
+    SnapshotField("next_service_mile_value", ("vehicleConfig.maintenance.nextServiceMile",), float),
+    SnapshotField("latitude", ("lastVehicleInfo.location.coord.lat",), float),
+    SnapshotField("longitude", ("lastVehicleInfo.location.coord.lon",), float),
+    SnapshotField("location_synced", ("lastVehicleInfo.location.syncDate.utc",), _utc_datetime),
+    SnapshotField("doors_locked", (f"{STATUS}.doorLock",), bool),
+    SnapshotField("car_battery_level", (f"{STATUS}.batteryStatus.stateOfCharge",), int),
+    SnapshotField("last_synced_to_cloud", (f"{STATUS}.syncDate.utc",), _utc_datetime),
+    SnapshotField("last_synced_from_cloud", (f"{STATUS}.dateTime.utc",), _utc_datetime),
+    SnapshotField("climate_hvac_on", (f"{STATUS}.climate.airCtrl",), bool),
+    SnapshotField("climate_temperature_value", (f"{STATUS}.climate.airTemp.value",), _temperature),
+    SnapshotField("climate_defrost_on", (f"{STATUS}.climate.defrost",), bool),
+    SnapshotField("climate_heated_rear_window_on", (f"{STATUS}.climate.heatingAccessory.rearWindow",), bool),
+    SnapshotField("climate_heated_side_mirror_on", (f"{STATUS}.climate.heatingAccessory.sideMirror",), bool),
+    SnapshotField("climate_heated_steering_wheel_on", (f"{STATUS}.climate.heatingAccessory.steeringWheel",), bool),
+    SnapshotField("climate_driver_seat", (f"{STATUS}.climate.heatVentSeat.driverSeat",), _seat),
+    SnapshotField("climate_passenger_seat", (f"{STATUS}.climate.heatVentSeat.passengerSeat",), _seat),
+    SnapshotField("climate_left_rear_seat", (f"{STATUS}.climate.heatVentSeat.rearLeftSeat",), _seat),
+    SnapshotField("climate_right_rear_seat", (f"{STATUS}.climate.heatVentSeat.rearRightSeat",), _seat),
+    SnapshotField("door_hood_open", (f"{STATUS}.doorStatus.hood",), bool),
+    SnapshotField("door_trunk_open", (f"{STATUS}.doorStatus.trunk",), bool),
+    SnapshotField("door_front_left_open", (f"{STATUS}.doorStatus.frontLeft",), bool),
+    SnapshotField("door_front_right_open", (f"{STATUS}.doorStatus.frontRight",), bool),
+    SnapshotField("door_back_left_open", (f"{STATUS}.doorStatus.backLeft",), bool),
+    SnapshotField("door_back_right_open", (f"{STATUS}.doorStatus.backRight",), bool),
+    SnapshotField("engine_on", (f"{STATUS}.engine",), bool),
+    SnapshotField("tire_all_on", (f"{STATUS}.tirePressure.all",), bool),
+    SnapshotField("low_fuel_light_on", (f"{STATUS}.lowFuelLight",), bool),
+    SnapshotField("fuel_level", (f"{STATUS}.fuelLevel",), float),
+    SnapshotField("ev_battery_level", (f"{EV_STATUS}.batteryStatus",), int),
+    SnapshotField("ev_battery_charging", (f"{EV_STATUS}.batteryCharge",), bool),
+    SnapshotField("ev_plugged_in", (f"{EV_STATUS}.batteryPlugin",), bool),
+    SnapshotField("ev_plug_type", (f"{EV_STATUS}.batteryPlugin",), int),
+    SnapshotField("ev_charge_limits_ac", (f"{EV_STATUS}.targetSOC.1.targetSOClevel",), int),
+    SnapshotField("ev_charge_limits_dc", (f"{EV_STATUS}.targetSOC.0.targetSOClevel",), int),
+    SnapshotField(
+        "ev_charge_current_remaining_duration",
+        (f"{EV_STATUS}.remainChargeTime.0.timeInterval.value",),
+        int,
+    ),
+    SnapshotField(
+        "ev_remaining_range_value",
+        (f"{EV_STATUS}.drvDistance.0.rangeByFuel.evModeRange.value",),
+        int,
+    ),
+    SnapshotField(
+        "fuel_remaining_range_value",
+        (f"{EV_STATUS}.drvDistance.0.rangeByFuel.gasModeRange.value", f"{STATUS}.distanceToEmpty.value"),
+        int,
+    ),
+    SnapshotField(
+        "total_remaining_range_value",
+        (f"{EV_STATUS}.drvDistance.0.rangeByFuel.totalAvailableRange.value", f"{STATUS}.distanceToEmpty.value"),
+        int,
+    ),
+)
+FIELD_NAMES: Final[tuple[str, ...]] = tuple(field.name for field in FIELDS)
+
+
+class _TrieNode:
+    """One path segment, leaves are (field index, path index) pairs ending here."""
+
+    __slots__ = ("children", "leaves")
+
+    def __init__(self) -> None:
+        self.children: dict[str, tuple[int | None, _TrieNode]] = {}
+        self.leaves: list[tuple[int, int]] = []
+
+
+def _compile(fields: tuple[SnapshotField, ...]) -> _TrieNode:
+    root = _TrieNode()
+    for field_index, field in enumerate(fields):
+        for path_index, path in enumerate(field.paths):
+            node = root
+            for segment in path.split("."):
+                if segment not in node.children:
+                    index = int(segment) if segment.isdigit() else None
+                    node.children[segment] = (index, _TrieNode())
+                node = node.children[segment][1]
+            node.leaves.append((field_index, path_index))
+    return root
+
+
+_TRIE: Final = _compile(FIELDS)
+
+
+def _walk(node: _TrieNode, value, raw: list[list]) -> None:
+    for field_index, path_index in node.leaves:
+        raw[field_index][path_index] = value
+    for segment, (index, child) in node.children.items():
+        if isinstance(value, dict):
+            child_value = value.get(segment)
+        elif isinstance(value, list) and index is not None and index < len(value):
+            child_value = value[index]
+        else:
+            continue
+        if child_value is not None:
+            _walk(child, child_value, raw)
+
+
+class VehicleSnapshot:
+    """Immutable by convention view of one refresh, one slot per field."""
+
+    __slots__ = FIELD_NAMES
+
+    def __init__(self, values: tuple | None = None) -> None:
+        if values is None:
+            values = (None,) * len(FIELD_NAMES)
+        for name, value in zip(FIELD_NAMES, values):
+            object.__setattr__(self, name, value)
+
+    def changed_fields(self, other: "VehicleSnapshot") -> set[str]:
+        """Return the names of the fields whose value differs from other."""
+        return {name for name in FIELD_NAMES if getattr(self, name) != getattr(other, name)}
+
+    def replace(self, values: dict[str, Any]) -> "VehicleSnapshot":
+        """Return a copy with the given fields set."""
+        return VehicleSnapshot(tuple(
+            values[name] if name in values else getattr(self, name) for name in FIELD_NAMES
+        ))
+
+    def __repr__(self) -> str:
+        return f"VehicleSnapshot({', '.join(f'{name}={getattr(self, name)!r}' for name in FIELD_NAMES)})"
+
+
+def build_snapshot(data: dict[str, Any] | None) -> VehicleSnapshot:
+    """Walk the payload once and cast every declared field."""
+    if data is None:
+        return VehicleSnapshot()
+    raw = [[None] * len(field.paths) for field in FIELDS]
+    _walk(_TRIE, data, raw)
+    values = []
+    for field, field_raw in zip(FIELDS, raw):
+        value = None
+        for path_value in field_raw:
+            try:
+                value = cast_json_value(path_value, field.cast)
+            except (TypeError, ValueError):
+                value = None
+            if value:
+                break
+        values.append(value)
+    return VehicleSnapshot(tuple(values))
@@ -0,0 +1,63 @@
+"""Persist the last successful vehicle payload and capabilities so setup can start from them."""
+
+from datetime import datetime
+from logging import getLogger
+from typing import Any, Final
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = getLogger(__name__)
+
+STORAGE_VERSION: Final = 1
+SAVE_DELAY: Final = 60
+# runtime only keys added to the payload by the coordinator
+RUNTIME_KEYS: Final = frozenset({"last_action_status"})
+
+
+class VehicleStore:
+    """Last known payload, capability profile, name and model of one vehicle."""
+
+    def __init__(self, hass: HomeAssistant, vehicle_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{vehicle_id}")
+        self._pending: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        stored = await self._store.async_load()
+        if stored is None or stored.get("data") is None:
+            return None
+        _LOGGER.debug("restored last known vehicle payload")
+        return stored
+
+    @callback
+    def async_save(
+            self,
+            vehicle_name: str,
+            vehicle_model: str,
+            data: dict[str, Any],
+            capabilities: dict[str, Any],
+            refreshed_at: datetime,
+    ) -> None:
+        """Schedule a write of the payload, writes within the delay are merged."""
+        self._pending = {
+            "vehicle_name": vehicle_name,
+            "vehicle_model": vehicle_model,
+            "data": {key: value for key, value in data.items() if key not in RUNTIME_KEYS},
+            "capabilities": capabilities,
+            "refreshed_at": refreshed_at.isoformat(),
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return self._pending
+
+    async def async_flush(self) -> None:
+        """Write a scheduled save now."""
+        if self._pending is not None:
+            await self._store.async_save(self._pending)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
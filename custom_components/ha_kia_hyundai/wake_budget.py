@@ -0,0 +1,107 @@
+"""Decide between a cached read and waking the vehicle, within a daily budget."""
+
+from asyncio import Task, shield
+from collections import deque
+from datetime import timedelta
+from enum import StrEnum
+from logging import getLogger
+from time import monotonic
+from typing import TYPE_CHECKING, Final
+
+from homeassistant.util import dt as dt_util
+
+from .command_queue import ACTION_TIMEOUT
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .vehicle_coordinator import VehicleCoordinator
+
+_LOGGER = getLogger(__name__)
+
+# used by the button
+DEFAULT_MAX_AGE: Final = timedelta(minutes=5)
+# 12v battery level below which the vehicle is not woken
+MIN_WAKE_CAR_BATTERY_LEVEL: Final = 60
+BUDGET_PERIOD_SECONDS: Final = 86400
+
+
+class WakeResult(StrEnum):
+    FRESH = "fresh"
+    CACHED = "cached"
+    WOKEN = "woken"
+    LOW_BATTERY = "low_battery"
+    BUDGET_EXHAUSTED = "budget_exhausted"
+    REFRESH_FAILED = "refresh_failed"
+
+
+class WakeBudget:
+    """Get data no older than asked for with the fewest wake ups, one wake at a time."""
+
+    def __init__(self, coordinator: "VehicleCoordinator", daily_wakes: int) -> None:
+        self._coordinator = coordinator
+        self._daily_wakes: int = daily_wakes
+        self._wakes: deque[float] = deque()
+        self._wake: Task | None = None
+
+    @property
+    def remaining(self) -> int:
+        """Return the wake ups left in the last 24 hours."""
+        cutoff = monotonic() - BUDGET_PERIOD_SECONDS
+        while self._wakes and self._wakes[0] < cutoff:
+            self._wakes.popleft()
+        return max(0, self._daily_wakes - len(self._wakes))
+
+    def data_age(self) -> timedelta | None:
+        synced = self._coordinator.reported_snapshot.last_synced_to_cloud
+        if synced is None:
+            return None
+        return dt_util.utcnow() - synced
+
+    def _is_fresh(self, max_age: timedelta) -> bool:
+        age = self.data_age()
+        return age is not None and age <= max_age
+
+    async def async_refresh(self, max_age: timedelta) -> WakeResult:
+        """Make the data at most max_age old, waking the vehicle only if a cached read is not enough."""
+        if self._wake is not None and not self._wake.done():
+            _LOGGER.debug("joining wake up in progress")
+            return await shield(self._wake)
+        if self._is_fresh(max_age):
+            return WakeResult.FRESH
+        coordinator = self._coordinator
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            # a wake up would not get through either
+            _LOGGER.warning(f"not waking {coordinator.vehicle_name}, reading the cloud failed: {coordinator.last_exception}")
+            return WakeResult.REFRESH_FAILED
+        if self._is_fresh(max_age):
+            return WakeResult.CACHED
+        if self._wake is not None and not self._wake.done():
+            # started while the cached read was running
+            return await shield(self._wake)
+        car_battery_level = coordinator.reported_snapshot.car_battery_level
+        if car_battery_level is not None and car_battery_level < MIN_WAKE_CAR_BATTERY_LEVEL:
+            _LOGGER.warning(f"not waking {coordinator.vehicle_name}, 12v battery at {car_battery_level}%")
+            return WakeResult.LOW_BATTERY
+        if self.remaining == 0:
+            _LOGGER.warning(f"not waking {coordinator.vehicle_name}, {self._daily_wakes} wake ups used in the last 24 hours")
+            return WakeResult.BUDGET_EXHAUSTED
+        self._wake = coordinator.config_entry.async_create_task(
+            coordinator.hass,
+            self._async_wake(),
+            name=f"{DOMAIN}-{coordinator.vehicle_id}-wake",
+        )
+        return await shield(self._wake)
+
+    async def _async_wake(self) -> WakeResult:
+        coordinator = self._coordinator
+        try:
+            await coordinator.command_queue.async_run("request_vehicle_data_sync")
+            # only wake ups the cloud accepted count against the budget
+            self._wakes.append(monotonic())
+            await coordinator.action_tracker.async_wait(ACTION_TIMEOUT)
+            # the refresh the tracker requests is debounced, read the woken data now
+            await coordinator.async_refresh()
+        finally:
+            self._wake = None
+        return WakeResult.WOKEN
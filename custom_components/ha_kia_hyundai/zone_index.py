@@ -0,0 +1,92 @@
+"""Grid index of the Home Assistant zones to resolve the zone of a location."""
+
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+
+from homeassistant.components.zone import ENTITY_ID_HOME
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE, ATTR_RADIUS, STATE_HOME, STATE_NOT_HOME
+from homeassistant.core import State
+from homeassistant.util.location import distance
+
+# about 1.1 km of latitude
+CELL_DEGREES: Final = 0.01
+METERS_PER_DEGREE: Final = 111_320
+# zones spanning more cells are checked for every lookup instead
+MAX_CELLS_PER_ZONE: Final = 400
+ATTR_PASSIVE: Final = "passive"
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedZone:
+    entity_id: str
+    name: str
+    latitude: float
+    longitude: float
+    radius: float
+
+
+def _cell(latitude: float, longitude: float) -> tuple[int, int]:
+    return math.floor(latitude / CELL_DEGREES), math.floor(longitude / CELL_DEGREES)
+
+
+class ZoneIndex:
+    """Zones bucketed by the grid cells their circle touches."""
+
+    def __init__(self, zones: Iterable[IndexedZone]) -> None:
+        self._cells: defaultdict[tuple[int, int], list[IndexedZone]] = defaultdict(list)
+        self._large: list[IndexedZone] = []
+        for zone in zones:
+            latitude_span = zone.radius / METERS_PER_DEGREE
+            longitude_span = latitude_span / max(math.cos(math.radians(zone.latitude)), 0.01)
+            low = _cell(zone.latitude - latitude_span, zone.longitude - longitude_span)
+            high = _cell(zone.latitude + latitude_span, zone.longitude + longitude_span)
+            if (high[0] - low[0] + 1) * (high[1] - low[1] + 1) > MAX_CELLS_PER_ZONE:
+                self._large.append(zone)
+                continue
+            for row in range(low[0], high[0] + 1):
+                for column in range(low[1], high[1] + 1):
+                    self._cells[(row, column)].append(zone)
+
+    @classmethod
+    def from_states(cls, states: Iterable[State]) -> "ZoneIndex":
+        """Index the active zones among the zone entity states."""
+        return cls(
+            IndexedZone(
+                entity_id=state.entity_id,
+                name=state.name,
+                latitude=state.attributes[ATTR_LATITUDE],
+                longitude=state.attributes[ATTR_LONGITUDE],
+                radius=state.attributes.get(ATTR_RADIUS, 0),
+            )
+            for state in states
+            if not state.attributes.get(ATTR_PASSIVE)
+            and ATTR_LATITUDE in state.attributes
+            and ATTR_LONGITUDE in state.attributes
+        )
+
+    def active_zone(self, latitude: float, longitude: float) -> IndexedZone | None:
+        """Return the closest zone containing the location, the smaller one on a tie."""
+        closest: IndexedZone | None = None
+        closest_distance = math.inf
+        for zone in (*self._cells.get(_cell(latitude, longitude), ()), *self._large):
+            zone_distance = distance(latitude, longitude, zone.latitude, zone.longitude)
+            if zone_distance is None or zone_distance >= zone.radius:
+                continue
+            if zone_distance < closest_distance or (
+                zone_distance == closest_distance and zone.radius < closest.radius
+            ):
+                closest = zone
+                closest_distance = zone_distance
+        return closest
+
+    def location_name(self, latitude: float, longitude: float) -> str:
+        """Return the tracker state for the location the way device_tracker names zones."""
+        zone = self.active_zone(latitude, longitude)
+        if zone is None:
+            return STATE_NOT_HOME
+        if zone.entity_id == ENTITY_ID_HOME:
+            return STATE_HOME
+        return zone.name